@@ -14,22 +14,44 @@ Features:
 - Streak analysis
 """
 
+from collections import deque
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
-import statistics
+from types import MappingProxyType
+from typing import Any, Deque, Dict, Final, List, Mapping, Optional, Sequence, Tuple, Union
+from operator import itemgetter
+import asyncio
+import logging
 import math
+import time
 
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+# Calculator inputs: plain sequences or the columns returned by get_rounds
+Multipliers = Union[Sequence[float], np.ndarray]
+Timestamps = Union[Sequence[datetime], np.ndarray]
 
 
 # =============================================================================
 # Models
 # =============================================================================
 
+class PeriodLiteral(str, Enum):
+    """Supported statistics periods."""
+    h1 = "1h"
+    h6 = "6h"
+    h24 = "24h"
+    d7 = "7d"
+    d30 = "30d"
+
+
 class CrashThresholds(BaseModel):
     """Configurable thresholds for crash analysis."""
     instant_crash: float = 1.10
@@ -45,6 +67,8 @@ class CrashThresholds(BaseModel):
 
 class CrashAnalysis(BaseModel):
     """Crash point analysis."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total_rounds: int
     average_crash: float
     median_crash: float
@@ -72,6 +96,8 @@ class CrashAnalysis(BaseModel):
 
 class CashoutOptimizer(BaseModel):
     """Cashout point optimization data."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     target_multiplier: float
     win_rate: float = Field(..., description="Probability of reaching target (%)")
     expected_value: float = Field(..., description="Expected value per unit bet")
@@ -79,8 +105,14 @@ class CashoutOptimizer(BaseModel):
     recommended: bool = Field(..., description="Is this target recommended?")
 
 
+# Validates a whole cashout table in one pass
+_CASHOUT_ADAPTER: Final[TypeAdapter] = TypeAdapter(List[CashoutOptimizer])
+
+
 class QuickCrashAlert(BaseModel):
     """Quick crash alert data."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     last_10_quick_crashes: int = Field(..., description="<1.5x in last 10 rounds")
     last_20_quick_crashes: int
     last_50_quick_crashes: int
@@ -90,6 +122,8 @@ class QuickCrashAlert(BaseModel):
 
 class MoonTracker(BaseModel):
     """Moon (1000x+) tracking data."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     total_moons: int
     last_moon_value: Optional[float] = None
     last_moon_time: Optional[datetime] = None
@@ -100,6 +134,8 @@ class MoonTracker(BaseModel):
 
 class CrashGameStatistics(BaseModel):
     """Complete crash game statistics."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     game: str
     period: str
     generated_at: datetime
@@ -123,109 +159,154 @@ class CrashGameStatistics(BaseModel):
     worst_hours: List[Dict[str, Any]]
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _as_datetime(value: Any) -> datetime:
+    """Convert a numpy datetime64 element to a datetime; pass others through."""
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[us]").astype(datetime)
+    return value
+
+
+def _streak_summary(runs: np.ndarray) -> Dict[str, Any]:
+    """Summarize an array of streak lengths."""
+    if runs.size == 0:
+        return {"max": 0, "average": 0, "total": 0}
+    return {
+        "max": int(runs.max()),
+        "average": round(float(runs.mean()), 2),
+        "total": int(runs.size),
+    }
+
+
 # =============================================================================
 # Calculator
 # =============================================================================
 
+_DEFAULT_THRESHOLDS: Final[CrashThresholds] = CrashThresholds()
+
+
 class CrashGameCalculator:
     """Calculates crash game specific statistics."""
 
     def __init__(self, thresholds: Optional[CrashThresholds] = None):
-        self.thresholds = thresholds or CrashThresholds()
+        self.thresholds = thresholds or _DEFAULT_THRESHOLDS
 
     def analyze_crashes(
         self,
-        multipliers: List[float],
-        timestamps: Optional[List[datetime]] = None,
+        multipliers: Multipliers,
+        timestamps: Optional[Timestamps] = None,
     ) -> CrashAnalysis:
         """Analyze crash points."""
-        if not multipliers:
-            return CrashAnalysis(
+        if len(multipliers) == 0:
+            return CrashAnalysis.model_construct(
                 total_rounds=0,
-                average_crash=0,
-                median_crash=0,
-                std_deviation=0,
-                instant_crash_rate=0,
-                quick_crash_rate=0,
-                early_crash_rate=0,
-                good_round_rate=0,
-                great_round_rate=0,
-                big_win_rate=0,
-                huge_win_rate=0,
-                mega_win_rate=0,
-                moon_rate=0,
-                highest_crash=0,
-                lowest_crash=0,
+                average_crash=0.0,
+                median_crash=0.0,
+                std_deviation=0.0,
+                instant_crash_rate=0.0,
+                quick_crash_rate=0.0,
+                early_crash_rate=0.0,
+                good_round_rate=0.0,
+                great_round_rate=0.0,
+                big_win_rate=0.0,
+                huge_win_rate=0.0,
+                mega_win_rate=0.0,
+                moon_rate=0.0,
+                highest_crash=0.0,
+                lowest_crash=0.0,
             )
 
         n = len(multipliers)
         t = self.thresholds
+        arr = np.asarray(multipliers, dtype=np.float64)
 
         # Basic stats
-        avg = statistics.mean(multipliers)
-        med = statistics.median(multipliers)
-        std = statistics.stdev(multipliers) if n > 1 else 0
-
-        # Calculate rates
-        instant = sum(1 for m in multipliers if m < t.instant_crash) / n * 100
-        quick = sum(1 for m in multipliers if m < t.quick_crash) / n * 100
-        early = sum(1 for m in multipliers if m < t.early_crash) / n * 100
-        good = sum(1 for m in multipliers if m >= t.good_round) / n * 100
-        great = sum(1 for m in multipliers if m >= t.great_round) / n * 100
-        big = sum(1 for m in multipliers if m >= t.big_win) / n * 100
-        huge = sum(1 for m in multipliers if m >= t.huge_win) / n * 100
-        mega = sum(1 for m in multipliers if m >= t.mega_win) / n * 100
-        moon = sum(1 for m in multipliers if m >= t.moon) / n * 100
-
-        # Find last moon
+        avg = float(arr.mean())
+        med = float(np.median(arr))
+        std = float(arr.std(ddof=1)) if n > 1 else 0
+
+        # Calculate rates: label each round with its threshold bucket and
+        # count labels once. Cumulative bucket counts give the "< threshold"
+        # totals, ">= threshold" is the rest. Thresholds must be ascending.
+        edges = np.array([
+            t.instant_crash, t.quick_crash, t.early_crash,
+            t.good_round, t.great_round, t.big_win,
+            t.huge_win, t.mega_win, t.moon,
+        ])
+        hist = np.bincount(np.digitize(arr, edges), minlength=edges.size + 1)
+        below = np.cumsum(hist)[:-1]
+        rates = np.concatenate((below[:3], n - below[3:])) * (100.0 / n)
+
+        # Round every rate in one pass; the moon rate keeps extra precision
+        instant, quick, early, good, great, big, huge, mega, _ = np.round(rates, 2).tolist()
+        moon = round(float(rates[-1]), 4)
+
+        # Find last moon (rounds are newest first)
         last_moon_time = None
         rounds_since = None
-        if timestamps:
-            for i, m in enumerate(multipliers):
-                if m >= t.moon:
-                    last_moon_time = timestamps[i]
-                    rounds_since = i
-                    break
+        if timestamps is not None and len(timestamps):
+            idx = int(np.argmax(arr >= t.moon))
+            if arr[idx] >= t.moon:
+                last_moon_time = _as_datetime(timestamps[idx])
+                rounds_since = idx
 
-        return CrashAnalysis(
+        return CrashAnalysis.model_construct(
             total_rounds=n,
             average_crash=round(avg, 4),
             median_crash=round(med, 4),
             std_deviation=round(std, 4),
-            instant_crash_rate=round(instant, 2),
-            quick_crash_rate=round(quick, 2),
-            early_crash_rate=round(early, 2),
-            good_round_rate=round(good, 2),
-            great_round_rate=round(great, 2),
-            big_win_rate=round(big, 2),
-            huge_win_rate=round(huge, 2),
-            mega_win_rate=round(mega, 2),
-            moon_rate=round(moon, 4),
-            highest_crash=max(multipliers),
-            lowest_crash=min(multipliers),
+            instant_crash_rate=instant,
+            quick_crash_rate=quick,
+            early_crash_rate=early,
+            good_round_rate=good,
+            great_round_rate=great,
+            big_win_rate=big,
+            huge_win_rate=huge,
+            mega_win_rate=mega,
+            moon_rate=moon,
+            highest_crash=float(arr.max()),
+            lowest_crash=float(arr.min()),
             last_moon=last_moon_time,
             rounds_since_moon=rounds_since,
         )
 
     def calculate_quick_crash_alert(
         self,
-        multipliers: List[float],
+        multipliers: Multipliers,
     ) -> QuickCrashAlert:
         """Calculate quick crash alert level."""
         t = self.thresholds
 
-        # Count quick crashes in recent rounds
-        last_10 = sum(1 for m in multipliers[:10] if m < t.quick_crash)
-        last_20 = sum(1 for m in multipliers[:20] if m < t.quick_crash)
-        last_50 = sum(1 for m in multipliers[:50] if m < t.quick_crash)
+        threshold = t.quick_crash
 
-        # Count consecutive quick crashes
+        # Count quick crashes in recent rounds and the leading run of
+        # consecutive quick crashes in a single pass over the last 50
+        last_10 = last_20 = last_50 = 0
         consecutive = 0
-        for m in multipliers:
-            if m < t.quick_crash:
+        in_streak = True
+        window = np.asarray(multipliers[:50], dtype=np.float64).tolist()
+        for i, m in enumerate(window):
+            hit = m < threshold
+            last_50 += hit
+            if i < 20:
+                last_20 += hit
+            if i < 10:
+                last_10 += hit
+            if in_streak:
+                if hit:
+                    consecutive += 1
+                else:
+                    in_streak = False
+
+        # A streak covering the whole window may continue further back
+        if in_streak:
+            for m in multipliers[50:]:
+                if m >= threshold:
+                    break
                 consecutive += 1
-            else:
-                break
 
         # Determine alert level
         if consecutive >= 5 or last_10 >= 7:
@@ -237,7 +318,7 @@ class CrashGameCalculator:
         else:
             level = "low"
 
-        return QuickCrashAlert(
+        return QuickCrashAlert.model_construct(
             last_10_quick_crashes=last_10,
             last_20_quick_crashes=last_20,
             last_50_quick_crashes=last_50,
@@ -247,37 +328,38 @@ class CrashGameCalculator:
 
     def track_moons(
         self,
-        multipliers: List[float],
-        timestamps: Optional[List[datetime]] = None,
+        multipliers: Multipliers,
+        timestamps: Optional[Timestamps] = None,
     ) -> MoonTracker:
         """Track moon (1000x+) occurrences."""
         t = self.thresholds
 
-        moon_indices = [i for i, m in enumerate(multipliers) if m >= t.moon]
-        total_moons = len(moon_indices)
+        arr = np.asarray(multipliers, dtype=np.float64)
+        moon_mask = arr >= t.moon
+        total_moons = int(np.count_nonzero(moon_mask))
 
         # Last moon info
         last_value = None
         last_time = None
-        rounds_since = len(multipliers)
+        rounds_since = len(arr)
+        avg_between = None
 
-        if moon_indices:
-            last_idx = moon_indices[0]
-            last_value = multipliers[last_idx]
+        if total_moons:
+            moon_indices = np.flatnonzero(moon_mask)
+            last_idx = int(moon_indices[0])
+            last_value = float(arr[last_idx])
             rounds_since = last_idx
-            if timestamps and last_idx < len(timestamps):
-                last_time = timestamps[last_idx]
+            if timestamps is not None and last_idx < len(timestamps):
+                last_time = _as_datetime(timestamps[last_idx])
 
-        # Average rounds between moons
-        avg_between = None
-        if len(moon_indices) > 1:
-            gaps = [moon_indices[i] - moon_indices[i+1] for i in range(len(moon_indices)-1)]
-            avg_between = statistics.mean(gaps)
+            # Average rounds between moons
+            if total_moons > 1:
+                avg_between = float(np.diff(moon_indices).mean())
 
         # Estimated probability
-        probability = (total_moons / len(multipliers) * 100) if multipliers else 0
+        probability = (total_moons / len(arr) * 100) if len(arr) else 0.0
 
-        return MoonTracker(
+        return MoonTracker.model_construct(
             total_moons=total_moons,
             last_moon_value=last_value,
             last_moon_time=last_time,
@@ -288,7 +370,7 @@ class CrashGameCalculator:
 
     def optimize_cashout(
         self,
-        multipliers: List[float],
+        multipliers: Multipliers,
         targets: Optional[List[float]] = None,
     ) -> List[CashoutOptimizer]:
         """Calculate optimal cashout points."""
@@ -299,114 +381,107 @@ class CrashGameCalculator:
         if n == 0:
             return []
 
-        results = []
-        for target in targets:
-            # Win rate = probability of crash >= target
-            wins = sum(1 for m in multipliers if m >= target)
-            win_rate = wins / n * 100
-
-            # Expected value = (win_rate * target) - (1 - win_rate)
-            # Assuming unit bet
-            ev = (win_rate / 100 * target) - (1 - win_rate / 100)
-
-            # Risk/reward ratio
-            risk_reward = target / (100 / win_rate) if win_rate > 0 else 0
-
-            # Recommendation (EV > 0.9 and win_rate reasonable)
-            recommended = ev > 0.9 and win_rate >= 30
-
-            results.append(CashoutOptimizer(
-                target_multiplier=target,
-                win_rate=round(win_rate, 2),
-                expected_value=round(ev, 4),
-                risk_reward_ratio=round(risk_reward, 4),
-                recommended=recommended,
-            ))
-
-        return results
+        arr_sorted = np.sort(np.asarray(multipliers, dtype=np.float64))
+        tgts = np.asarray(targets, dtype=np.float64)
+
+        # Win rate = probability of crash >= target
+        wins = n - np.searchsorted(arr_sorted, tgts, side="left")
+        win_rates = wins * (100.0 / n)
+        p_win = win_rates / 100
+
+        # Expected value = (win_rate * target) - (1 - win_rate)
+        # Assuming unit bet
+        ev = p_win * tgts - (1 - p_win)
+
+        # Risk/reward ratio
+        risk_reward = np.where(win_rates > 0, tgts * p_win, 0.0)
+
+        # Recommendation (EV > 0.9 and win_rate reasonable)
+        recommended = (ev > 0.9) & (win_rates >= 30)
+
+        payload = [
+            {
+                "target_multiplier": float(target),
+                "win_rate": win_rate,
+                "expected_value": e,
+                "risk_reward_ratio": rr,
+                "recommended": rec,
+            }
+            for target, win_rate, e, rr, rec in zip(
+                targets,
+                np.round(win_rates, 2).tolist(),
+                np.round(ev, 4).tolist(),
+                np.round(risk_reward, 4).tolist(),
+                recommended.tolist(),
+            )
+        ]
+        return _CASHOUT_ADAPTER.validate_python(payload)
 
     def analyze_hourly_patterns(
         self,
-        rounds: List[Tuple[float, datetime]],
+        multipliers: Multipliers,
+        timestamps: Timestamps,
     ) -> Tuple[List[Dict], List[Dict]]:
         """Find best and worst hours."""
-        hourly: Dict[int, List[float]] = {h: [] for h in range(24)}
+        mults = np.asarray(multipliers, dtype=np.float64)
+        ts = np.asarray(timestamps, dtype="datetime64[us]")
+        hours = ts.astype("datetime64[h]").astype(np.int64) % 24
 
-        for multiplier, timestamp in rounds:
-            hourly[timestamp.hour].append(multiplier)
+        # Per-hour sums and counts in one scatter-add each
+        counts = np.bincount(hours, minlength=24)
+        sums = np.bincount(hours, weights=mults, minlength=24)
+        big_wins = np.bincount(hours, weights=(mults >= 10).astype(np.float64), minlength=24)
 
         # Calculate averages
-        hourly_stats = []
-        for hour in range(24):
-            if hourly[hour]:
-                avg = statistics.mean(hourly[hour])
-                big_win_rate = sum(1 for m in hourly[hour] if m >= 10) / len(hourly[hour]) * 100
-                hourly_stats.append({
-                    "hour": hour,
-                    "average": round(avg, 4),
-                    "rounds": len(hourly[hour]),
-                    "big_win_rate": round(big_win_rate, 2),
-                })
-
-        # Sort for best/worst
-        sorted_stats = sorted(hourly_stats, key=lambda x: x["average"], reverse=True)
-
-        best = sorted_stats[:3] if len(sorted_stats) >= 3 else sorted_stats
-        worst = sorted_stats[-3:][::-1] if len(sorted_stats) >= 3 else []
+        hourly_stats = [
+            {
+                "hour": int(hour),
+                "average": round(float(sums[hour] / counts[hour]), 4),
+                "rounds": int(counts[hour]),
+                "big_win_rate": round(float(big_wins[hour] / counts[hour] * 100), 2),
+            }
+            for hour in np.flatnonzero(counts)
+        ]
+
+        # One stable sort (at most 24 hours); worst comes only from hours
+        # outside the best three, so no hour is listed as both
+        sorted_stats = sorted(hourly_stats, key=itemgetter("average"), reverse=True)
+        best = sorted_stats[:3]
+        worst = sorted_stats[max(3, len(sorted_stats) - 3):][::-1]
 
         return best, worst
 
     def calculate_streaks(
         self,
-        multipliers: List[float],
+        multipliers: Multipliers,
         threshold: float = 2.0,
     ) -> Tuple[Dict, Dict]:
         """Calculate current and historical streaks."""
-        # Current streak
-        current_type = "below" if multipliers and multipliers[0] < threshold else "above"
-        current_count = 0
-        for m in multipliers:
-            if (current_type == "below" and m < threshold) or \
-               (current_type == "above" and m >= threshold):
-                current_count += 1
-            else:
-                break
-
-        # Historical streaks
-        below_streaks = []
-        above_streaks = []
-        current_below = 0
-        current_above = 0
-
-        for m in multipliers:
-            if m < threshold:
-                current_below += 1
-                if current_above > 0:
-                    above_streaks.append(current_above)
-                    current_above = 0
-            else:
-                current_above += 1
-                if current_below > 0:
-                    below_streaks.append(current_below)
-                    current_below = 0
+        arr = np.asarray(multipliers, dtype=np.float64)
+        if arr.size == 0:
+            empty = np.empty(0, dtype=np.intp)
+            current_streak = {"type": "above", "count": 0, "threshold": threshold}
+            streak_history = {"below": _streak_summary(empty), "above": _streak_summary(empty)}
+            return current_streak, streak_history
+
+        # Run-length encode the below/above sequence without branching
+        below = arr < threshold
+        run_starts = np.flatnonzero(np.concatenate(([True], below[1:] != below[:-1])))
+        run_lengths = np.diff(np.append(run_starts, arr.size))
+        run_is_below = below[run_starts]
 
         current_streak = {
-            "type": current_type,
-            "count": current_count,
+            "type": "below" if run_is_below[0] else "above",
+            "count": int(run_lengths[0]),
             "threshold": threshold,
         }
 
+        # The trailing run is still open, so history only counts closed runs
+        closed_lengths = run_lengths[:-1]
+        closed_below = run_is_below[:-1]
         streak_history = {
-            "below": {
-                "max": max(below_streaks) if below_streaks else 0,
-                "average": round(statistics.mean(below_streaks), 2) if below_streaks else 0,
-                "total": len(below_streaks),
-            },
-            "above": {
-                "max": max(above_streaks) if above_streaks else 0,
-                "average": round(statistics.mean(above_streaks), 2) if above_streaks else 0,
-                "total": len(above_streaks),
-            },
+            "below": _streak_summary(closed_lengths[closed_below]),
+            "above": _streak_summary(closed_lengths[~closed_below]),
         }
 
         return current_streak, streak_history
@@ -416,58 +491,150 @@ class CrashGameCalculator:
 # Service
 # =============================================================================
 
+# Hours of history covered by each period parameter
+_HOURS_MAP: Final[Mapping[str, int]] = MappingProxyType({
+    PeriodLiteral.h1: 1,
+    PeriodLiteral.h6: 6,
+    PeriodLiteral.h24: 24,
+    PeriodLiteral.d7: 168,
+    PeriodLiteral.d30: 720,
+})
+
+# Seconds a computed statistics payload stays fresh, per period.
+# Longer windows move more slowly, so they can be cached longer.
+STATS_CACHE_TTL: Final[Mapping[str, float]] = MappingProxyType({
+    "1h": 5.0,
+    "6h": 10.0,
+    "24h": 15.0,
+    "7d": 30.0,
+    "30d": 60.0,
+})
+
+
 class CrashGameStatsService:
-    """Service for crash game statistics."""
+    """
+    Service for crash game statistics.
+
+    Reads rounds through the host app's database manager, whose connect()
+    context manager lends out a pooled connection returning tuple rows.
+    """
 
-    def __init__(self, db_pool, game: str):
+    def __init__(self, db_pool, game: str, table: Optional[str] = None):
         self.db_pool = db_pool
         self.game = game
+        self.table = table or f"{game}_rounds"
         self.calculator = CrashGameCalculator()
+        self._cache: Dict[str, Tuple[float, CrashGameStatistics]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
 
     async def get_rounds(
         self,
         hours: Optional[int] = None,
         limit: Optional[int] = None,
-    ) -> List[Tuple[float, datetime]]:
-        """Fetch rounds from database."""
-        query = "SELECT crash_multiplier, created_at FROM rounds"
-        params = []
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fetch rounds from database as (multipliers, timestamps) columns."""
+        query = f"SELECT crash_multiplier, created_at FROM {self.table}"
+        params: List[Any] = []
 
         if hours:
+            # created_at holds SQLite's CURRENT_TIMESTAMP text, so compare
+            # against the same UTC format
             cutoff = datetime.utcnow() - timedelta(hours=hours)
             query += " WHERE created_at >= ?"
-            params.append(cutoff)
+            params.append(cutoff.strftime("%Y-%m-%d %H:%M:%S"))
 
+        # Filter, sort and LIMIT are answered from the host schema's covering
+        # created_at index (idx_rounds_page for spacexy_rounds)
         query += " ORDER BY created_at DESC"
 
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT ?"
+            params.append(limit)
+
+        async with self.db_pool.connect() as db:
+            cursor = await db.execute(query, params)
+            rows = await cursor.fetchall()
+
+        # Fill both columns in one pass instead of building per-row tuples
+        multipliers = np.empty(len(rows), dtype=np.float64)
+        timestamps = np.empty(len(rows), dtype="datetime64[us]")
+        for i, (multiplier, created_at) in enumerate(rows):
+            multipliers[i] = multiplier
+            timestamps[i] = created_at
+        return multipliers, timestamps
+
+    async def get_new_multipliers(
+        self,
+        after_id: int,
+        limit: int,
+    ) -> Tuple[int, np.ndarray]:
+        """
+        Fetch up to limit multipliers of rounds with an id above after_id.
+
+        Returns the highest id seen (after_id if nothing is new) and the
+        multipliers, newest first.
+        """
+        async with self.db_pool.connect() as db:
+            cursor = await db.execute(
+                f"SELECT id, crash_multiplier FROM {self.table} "
+                "WHERE id > ? ORDER BY id DESC LIMIT ?",
+                (after_id, limit),
+            )
+            rows = await cursor.fetchall()
 
-        async with self.db_pool.acquire() as conn:
-            rows = await conn.fetch(query, *params)
-            return [(float(row['crash_multiplier']), row['created_at']) for row in rows]
+        if not rows:
+            return after_id, np.empty(0, dtype=np.float64)
+        return rows[0][0], np.fromiter(
+            (multiplier for _, multiplier in rows), dtype=np.float64, count=len(rows)
+        )
 
     async def get_statistics(
         self,
         period: str = "24h",
     ) -> CrashGameStatistics:
-        """Get complete crash game statistics."""
+        """Get complete crash game statistics, cached for a short TTL."""
+        ttl = STATS_CACHE_TTL.get(period, STATS_CACHE_TTL["24h"])
+        cached = self._cache.get(period)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        # Only one request per period recomputes; the rest wait for it
+        lock = self._locks.setdefault(period, asyncio.Lock())
+        async with lock:
+            cached = self._cache.get(period)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            result = await self._compute_statistics(period)
+            self._cache[period] = (time.monotonic(), result)
+            return result
+
+    async def _compute_statistics(self, period: str) -> CrashGameStatistics:
+        """Fetch rounds and compute every statistics block for a period."""
         # Parse period
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 24)
+        hours = _HOURS_MAP.get(period, 24)
 
         # Fetch data
-        rounds = await self.get_rounds(hours=hours)
-        multipliers = [r[0] for r in rounds]
-        timestamps = [r[1] for r in rounds]
-
-        # Calculate all stats
-        crash_analysis = self.calculator.analyze_crashes(multipliers, timestamps)
-        quick_alert = self.calculator.calculate_quick_crash_alert(multipliers)
-        moon_tracker = self.calculator.track_moons(multipliers, timestamps)
-        cashout_targets = self.calculator.optimize_cashout(multipliers)
-        current_streak, streak_history = self.calculator.calculate_streaks(multipliers)
-        best_hours, worst_hours = self.calculator.analyze_hourly_patterns(rounds)
+        multipliers, timestamps = await self.get_rounds(hours=hours)
+
+        # Calculate all stats; the NumPy kernels release the GIL, so run
+        # them in worker threads and keep the event loop responsive
+        calc = self.calculator
+        (
+            crash_analysis,
+            quick_alert,
+            moon_tracker,
+            cashout_targets,
+            (current_streak, streak_history),
+            (best_hours, worst_hours),
+        ) = await asyncio.gather(
+            asyncio.to_thread(calc.analyze_crashes, multipliers, timestamps),
+            asyncio.to_thread(calc.calculate_quick_crash_alert, multipliers),
+            asyncio.to_thread(calc.track_moons, multipliers, timestamps),
+            asyncio.to_thread(calc.optimize_cashout, multipliers),
+            asyncio.to_thread(calc.calculate_streaks, multipliers),
+            asyncio.to_thread(calc.analyze_hourly_patterns, multipliers, timestamps),
+        )
 
         return CrashGameStatistics(
             game=self.game,
@@ -484,14 +651,130 @@ class CrashGameStatsService:
         )
 
 
+# =============================================================================
+# Background Aggregation
+# =============================================================================
+
+@dataclass
+class StatsSnapshot:
+    """Statistics precomputed over the most recent rounds."""
+    quick_crash_alert: QuickCrashAlert
+    updated_at: datetime
+
+
+class BackgroundStatsAggregator:
+    """
+    Keeps rolling statistics for a game up to date in the background.
+
+    Polls for new rounds once per round interval and recomputes the
+    snapshot only when rounds arrive, so request handlers serve a
+    precomputed result instead of querying the database. Rounds are
+    tracked by id, so rows written within the same second are not missed.
+    """
+
+    def __init__(
+        self,
+        service: CrashGameStatsService,
+        window: int = 50,
+        interval: float = 2.0,
+        max_interval: float = 60.0,
+    ):
+        self.service = service
+        self.interval = interval
+        self.max_interval = max_interval
+        self._multipliers: Deque[float] = deque(maxlen=window)
+        self._last_id: int = 0
+        self._snapshot: Optional[StatsSnapshot] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def snapshot(self) -> Optional[StatsSnapshot]:
+        """Latest precomputed statistics, or None before the first refresh."""
+        return self._snapshot
+
+    async def refresh(self) -> None:
+        """Pull rounds newer than the last seen one and rebuild the snapshot."""
+        # Only the newest rounds can land in the window, however many arrived
+        self._last_id, multipliers = await self.service.get_new_multipliers(
+            self._last_id, self._multipliers.maxlen
+        )
+
+        if len(multipliers) == 0 and self._snapshot is not None:
+            return
+
+        # Rows arrive newest first; keep the window newest first as well
+        self._multipliers.extendleft(reversed(multipliers.tolist()))
+
+        self._snapshot = StatsSnapshot(
+            quick_crash_alert=self.service.calculator.calculate_quick_crash_alert(
+                list(self._multipliers)
+            ),
+            updated_at=datetime.utcnow(),
+        )
+
+    async def _run(self) -> None:
+        # Failures are logged once and retried with exponential backoff;
+        # the first success after a failure is logged and resets the delay
+        delay = self.interval
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                if delay == self.interval:
+                    logger.warning(
+                        f"Stats aggregation for {self.service.game} failed, "
+                        f"backing off: {e}"
+                    )
+                delay = min(delay * 2, self.max_interval)
+            else:
+                if delay != self.interval:
+                    logger.info(f"Stats aggregation for {self.service.game} recovered")
+                delay = self.interval
+            await asyncio.sleep(delay)
+
+    def start(self) -> None:
+        """Start the polling task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the polling task and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
 # =============================================================================
 # Router Factory
 # =============================================================================
 
-def create_crash_game_router(db_pool, game: str) -> APIRouter:
-    """Create router for crash game statistics."""
-    router = APIRouter(prefix="/api/v2/crash", tags=["crash-stats"])
-    service = CrashGameStatsService(db_pool, game)
+def create_crash_game_router(db_pool, game: str, table: Optional[str] = None) -> APIRouter:
+    """
+    Create router for crash game statistics.
+
+    db_pool must provide a connect() async context manager yielding an
+    aiosqlite connection; table defaults to "<game>_rounds". The table
+    and its indexes are owned by the host app's schema.
+    """
+    service = CrashGameStatsService(db_pool, game, table)
+    aggregator = BackgroundStatsAggregator(service)
+
+    @asynccontextmanager
+    async def lifespan(_app):
+        aggregator.start()
+        try:
+            yield
+        finally:
+            await aggregator.stop()
+
+    router = APIRouter(
+        prefix="/api/v2/crash",
+        tags=["crash-stats"],
+        lifespan=lifespan,
+    )
 
     @router.get(
         "/{game_name}",
@@ -500,11 +783,11 @@ def create_crash_game_router(db_pool, game: str) -> APIRouter:
     )
     async def get_crash_stats(
         game_name: str,
-        period: str = Query("24h", regex="^(1h|6h|24h|7d|30d)$"),
+        period: PeriodLiteral = Query(PeriodLiteral.h24),
     ):
         if game_name != game:
             raise HTTPException(status_code=404, detail="Game not found")
-        return await service.get_statistics(period)
+        return await service.get_statistics(period.value)
 
     @router.get(
         "/{game_name}/quick-crash-alert",
@@ -514,8 +797,10 @@ def create_crash_game_router(db_pool, game: str) -> APIRouter:
     async def get_quick_crash_alert(game_name: str):
         if game_name != game:
             raise HTTPException(status_code=404, detail="Game not found")
-        rounds = await service.get_rounds(limit=50)
-        multipliers = [r[0] for r in rounds]
+        snapshot = aggregator.snapshot()
+        if snapshot is not None:
+            return snapshot.quick_crash_alert
+        multipliers, _ = await service.get_rounds(limit=50)
         return service.calculator.calculate_quick_crash_alert(multipliers)
 
     @router.get(
@@ -525,15 +810,12 @@ def create_crash_game_router(db_pool, game: str) -> APIRouter:
     )
     async def get_moon_tracker(
         game_name: str,
-        period: str = Query("7d"),
+        period: PeriodLiteral = Query(PeriodLiteral.d7),
     ):
         if game_name != game:
             raise HTTPException(status_code=404, detail="Game not found")
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 168)
-        rounds = await service.get_rounds(hours=hours)
-        multipliers = [r[0] for r in rounds]
-        timestamps = [r[1] for r in rounds]
+        hours = _HOURS_MAP.get(period, 168)
+        multipliers, timestamps = await service.get_rounds(hours=hours)
         return service.calculator.track_moons(multipliers, timestamps)
 
     @router.get(
@@ -543,14 +825,12 @@ def create_crash_game_router(db_pool, game: str) -> APIRouter:
     )
     async def get_cashout_optimizer(
         game_name: str,
-        period: str = Query("7d"),
+        period: PeriodLiteral = Query(PeriodLiteral.d7),
     ):
         if game_name != game:
             raise HTTPException(status_code=404, detail="Game not found")
-        hours_map = {"1h": 1, "6h": 6, "24h": 24, "7d": 168, "30d": 720}
-        hours = hours_map.get(period, 168)
-        rounds = await service.get_rounds(hours=hours)
-        multipliers = [r[0] for r in rounds]
+        hours = _HOURS_MAP.get(period, 168)
+        multipliers, _ = await service.get_rounds(hours=hours)
         return service.calculator.optimize_cashout(multipliers)
 
     return router
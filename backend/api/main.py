@@ -9,17 +9,24 @@ Author: Crash Games Team
 Version: 1.0.0
 """
 
+import asyncio
+import base64
+import binascii
 import logging
 import os
+import time
+from pathlib import Path
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import aiosqlite
+import orjson
 from fastapi import Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, TypeAdapter
 
 # Game-specific statistics
 from game_stats import create_crash_game_router
@@ -29,6 +36,40 @@ from game_stats import create_crash_game_router
 # Logging Configuration
 # =============================================================================
 
+class OrjsonFormatter(logging.Formatter):
+    """
+    Log formatter that serializes each record as one JSON object.
+
+    Unlike a %-style template, messages containing quotes, newlines or
+    tracebacks still produce valid JSON.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Serialize a log record to a JSON line.
+
+        Args:
+            record: The log record to format.
+
+        Returns:
+            str: JSON-encoded record.
+        """
+        payload: Dict[str, Any] = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
 def setup_logger(name: str) -> logging.Logger:
     """
     Configure and return a logger with structured formatting.
@@ -42,13 +83,7 @@ def setup_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"logger": "%(name)s", "module": "%(module)s", '
-            '"function": "%(funcName)s", "line": %(lineno)d, '
-            '"message": "%(message)s"}'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(OrjsonFormatter())
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
     return logger
@@ -64,6 +99,36 @@ logger = setup_logger(__name__)
 # Database path from environment variable with default fallback
 DATABASE_PATH: str = os.getenv("DATABASE_PATH", "spacexy.db")
 
+# Number of pooled read-only connections
+DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+
+# Pragmas for the single writer connection. WAL lets the pooled readers
+# run concurrently with writes.
+WRITE_PRAGMAS: tuple = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Pragmas applied once to every pooled read connection; mmap serves
+# large scans straight from the page cache.
+READ_PRAGMAS: tuple = (
+    "PRAGMA query_only=1",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Seconds aggregate results (counts, summary, distribution) are reused.
+# Rows only arrive from the collector, so brief staleness is acceptable.
+AGGREGATE_CACHE_TTL: float = float(os.getenv("AGGREGATE_CACHE_TTL", "5"))
+
+# Seconds the readiness probe reuses the last MAX(created_at) lookup
+HEALTH_CACHE_TTL: float = 2.0
+
+# Granularity (seconds) of the cached ISO timestamp in error/health responses
+TIMESTAMP_RESOLUTION: float = 0.05
+
 # CORS allowed origins - configurable via environment
 ALLOWED_ORIGINS: List[str] = [
     "http://localhost:3000",
@@ -86,6 +151,129 @@ DISTRIBUTION_BUCKETS: List[tuple] = [
 ]
 
 
+# =============================================================================
+# SQL Statements
+# =============================================================================
+
+SQL_COUNT_ROUNDS: str = "SELECT COUNT(*) FROM spacexy_rounds"
+
+# First page / legacy offset pagination
+SQL_SELECT_ROUNDS_PAGE: str = """
+    SELECT id, round_id, crash_multiplier, coordinate_x, coordinate_y, hash, created_at
+    FROM spacexy_rounds
+    ORDER BY created_at DESC, id DESC
+    LIMIT ? OFFSET ?
+"""
+
+# Keyset pagination: rows strictly older than the cursor position
+SQL_SELECT_ROUNDS_AFTER: str = """
+    SELECT id, round_id, crash_multiplier, coordinate_x, coordinate_y, hash, created_at
+    FROM spacexy_rounds
+    WHERE (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC
+    LIMIT ?
+"""
+
+SQL_SUMMARY: str = """
+    SELECT
+        COUNT(*) as total,
+        AVG(crash_multiplier) as avg,
+        MAX(crash_multiplier) as max,
+        MIN(crash_multiplier) as min,
+        SUM(CASE WHEN crash_multiplier < 2 THEN 1 ELSE 0 END) as under_2x,
+        SUM(CASE WHEN crash_multiplier >= 10 THEN 1 ELSE 0 END) as over_10x
+    FROM spacexy_rounds
+"""
+
+SQL_MEDIAN: str = """
+    SELECT crash_multiplier FROM spacexy_rounds
+    ORDER BY crash_multiplier
+    LIMIT 1 OFFSET ?
+"""
+
+# The LIMIT'd subquery runs as a co-routine over idx_rounds_page, so only the
+# newest rows are read and nothing is materialized. Ordering matches the
+# rounds page, so "last N" is the same set /api/rounds returns
+SQL_RECENT_STATS: str = """
+    SELECT
+        AVG(crash_multiplier) as avg_multiplier,
+        SUM(CASE WHEN crash_multiplier < 2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as under_2x_pct
+    FROM (
+        SELECT crash_multiplier
+        FROM spacexy_rounds
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+    )
+"""
+
+# Counts every distribution bucket plus the total in a single table scan
+SQL_DISTRIBUTION: str = "SELECT {buckets}, COUNT(*) AS total FROM spacexy_rounds".format(
+    buckets=", ".join(
+        f"SUM(CASE WHEN crash_multiplier {condition} THEN 1 ELSE 0 END) AS b{i}"
+        for i, (_, condition) in enumerate(DISTRIBUTION_BUCKETS)
+    )
+)
+
+SQL_HEALTH_LAST: str = "SELECT MAX(created_at) FROM spacexy_rounds"
+
+# Changes whenever rounds are added or removed; used as the aggregates' ETag
+SQL_DATA_VERSION: str = "SELECT COUNT(*), MAX(id) FROM spacexy_rounds"
+
+# Schema applied in order at startup; every statement is idempotent
+DDL_STATEMENTS: Tuple[str, ...] = (
+    # id is a plain rowid alias so inserts skip the sqlite_sequence
+    # bookkeeping AUTOINCREMENT requires
+    """
+    CREATE TABLE IF NOT EXISTS spacexy_rounds (
+        id INTEGER PRIMARY KEY,
+        round_id TEXT UNIQUE NOT NULL,
+        crash_multiplier REAL NOT NULL,
+        coordinate_x REAL,
+        coordinate_y REAL,
+        hash TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_multiplier ON spacexy_rounds(crash_multiplier)",
+    "CREATE INDEX IF NOT EXISTS idx_round_id ON spacexy_rounds(round_id)",
+    # Covering index: the rounds page is served without table lookups, and
+    # it replaces idx_created, which was a strict prefix of it
+    """
+    CREATE INDEX IF NOT EXISTS idx_rounds_page ON spacexy_rounds(
+        created_at DESC, id DESC,
+        round_id, crash_multiplier, coordinate_x, coordinate_y, hash
+    )
+    """,
+    "DROP INDEX IF EXISTS idx_created_id",
+    "DROP INDEX IF EXISTS idx_created",
+)
+
+SQL_ROUNDS_SCHEMA: str = (
+    "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'spacexy_rounds'"
+)
+
+# Rebuilds a table created with AUTOINCREMENT as a plain rowid alias,
+# keeping every id; indexes are recreated by init_schema() afterwards
+SQL_DROP_AUTOINCREMENT: str = """
+    BEGIN IMMEDIATE;
+    CREATE TABLE spacexy_rounds_new (
+        id INTEGER PRIMARY KEY,
+        round_id TEXT UNIQUE NOT NULL,
+        crash_multiplier REAL NOT NULL,
+        coordinate_x REAL,
+        coordinate_y REAL,
+        hash TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    INSERT INTO spacexy_rounds_new
+        SELECT id, round_id, crash_multiplier, coordinate_x, coordinate_y, hash, created_at
+        FROM spacexy_rounds;
+    DROP TABLE spacexy_rounds;
+    ALTER TABLE spacexy_rounds_new RENAME TO spacexy_rounds;
+    COMMIT;
+"""
+
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -116,10 +304,12 @@ class RoundsResponse(BaseModel):
 
     Attributes:
         items: List of Round objects.
-        total: Total number of rounds in the database.
+        total: Total number of rounds in the database, None if not requested.
+        next_cursor: Opaque cursor for the next page, None on the last page.
     """
     items: List[Round] = Field(..., description="List of game rounds")
-    total: int = Field(..., ge=0, description="Total number of rounds")
+    total: Optional[int] = Field(None, ge=0, description="Total number of rounds")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
 
 
 class SummaryStats(BaseModel):
@@ -170,6 +360,10 @@ class DistributionBucket(BaseModel):
     percentage: float = Field(..., ge=0, le=100, description="Percentage of total rounds")
 
 
+# Validates the whole bucket list in one pass
+_DISTRIBUTION_ADAPTER: TypeAdapter = TypeAdapter(List[DistributionBucket])
+
+
 class HealthResponse(BaseModel):
     """
     Health check response model.
@@ -210,37 +404,117 @@ class ErrorResponse(BaseModel):
 
 class DatabaseManager:
     """
-    Manages database connections using context managers for proper cleanup.
+    Manages a pool of read-only connections plus a single writer.
 
-    This class provides async context manager for database connections,
-    ensuring connections are properly closed after use.
+    Connections are opened once, tuned with READ_PRAGMAS/WRITE_PRAGMAS and
+    handed out through async context managers, so requests don't pay
+    connection setup each time and concurrent reads run in parallel.
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, pool_size: int = DB_POOL_SIZE) -> None:
         """
         Initialize the database manager.
 
         Args:
             db_path: Path to the SQLite database file.
+            pool_size: Number of pooled read-only connections.
         """
         self.db_path = db_path
+        self.pool_size = max(1, pool_size)
+        self._pool: asyncio.Queue = asyncio.Queue(maxsize=self.pool_size)
+        self._readers: List[aiosqlite.Connection] = []
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._writer_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+
+    async def open(self) -> None:
+        """
+        Open and configure the writer and pooled readers (no-op if open).
+
+        The writer is opened first so the database file exists and is in
+        WAL mode before the read-only connections attach to it.
+
+        Raises:
+            aiosqlite.Error: If a connection cannot be established. Any
+                connections opened before the failure are closed first.
+        """
+        async with self._open_lock:
+            if self._writer is not None:
+                return
+
+            writer: Optional[aiosqlite.Connection] = None
+            try:
+                writer = await aiosqlite.connect(self.db_path)
+                for pragma in WRITE_PRAGMAS:
+                    await writer.execute(pragma)
+
+                read_uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+                for _ in range(self.pool_size):
+                    db = await aiosqlite.connect(read_uri, uri=True)
+                    self._readers.append(db)
+                    for pragma in READ_PRAGMAS:
+                        await db.execute(pragma)
+                    self._pool.put_nowait(db)
+            except BaseException:
+                # Leave the manager empty so the next open() starts clean
+                while not self._pool.empty():
+                    self._pool.get_nowait()
+                for db in self._readers:
+                    await db.close()
+                self._readers.clear()
+                if writer is not None:
+                    await writer.close()
+                raise
+
+            self._writer = writer
+            logger.info(
+                f"Opened writer and {self.pool_size} read connections to {self.db_path}"
+            )
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the writer and read pool are currently open."""
+        return self._writer is not None
+
+    async def close(self) -> None:
+        """Close the writer and every pooled reader."""
+        while not self._pool.empty():
+            self._pool.get_nowait()
+        for db in self._readers:
+            await db.close()
+        self._readers.clear()
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+        logger.info("Database connections closed")
+
+    async def _ensure_open(self) -> None:
+        """Open the connections on first use, mapping failures to a 503."""
+        if self._writer is not None:
+            return
+        try:
+            await self.open()
+        except aiosqlite.Error as e:
+            logger.error(f"Database connection error: {e}")
+            raise HTTPException(
+                status_code=503,
+                detail="Database connection failed"
+            ) from e
 
     @asynccontextmanager
     async def connect(self) -> AsyncGenerator[aiosqlite.Connection, None]:
         """
-        Get a database connection using async context manager.
+        Borrow a pooled read-only connection using async context manager.
 
         Yields:
-            aiosqlite.Connection: Database connection with Row factory set.
+            aiosqlite.Connection: Read-only connection returning tuple rows.
 
         Raises:
-            DatabaseError: If connection cannot be established.
+            HTTPException: If the pool cannot be opened or a query fails.
         """
-        db: Optional[aiosqlite.Connection] = None
+        await self._ensure_open()
+        db = await self._pool.get()
         try:
-            db = await aiosqlite.connect(self.db_path)
-            db.row_factory = aiosqlite.Row
-            logger.debug(f"Database connection established to {self.db_path}")
             yield db
         except aiosqlite.Error as e:
             logger.error(f"Database connection error: {e}")
@@ -249,9 +523,19 @@ class DatabaseManager:
                 detail="Database connection failed"
             ) from e
         finally:
-            if db:
-                await db.close()
-                logger.debug("Database connection closed")
+            self._pool.put_nowait(db)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """
+        Get exclusive use of the writer connection.
+
+        Yields:
+            aiosqlite.Connection: The writer connection.
+        """
+        await self._ensure_open()
+        async with self._writer_lock:
+            yield self._writer
 
 
 # Create singleton database manager
@@ -263,7 +547,7 @@ async def get_db() -> AsyncGenerator[aiosqlite.Connection, None]:
     Dependency function for database connection injection.
 
     Yields:
-        aiosqlite.Connection: Database connection.
+        aiosqlite.Connection: Pooled read-only database connection.
 
     Example:
         @app.get("/api/data")
@@ -274,6 +558,59 @@ async def get_db() -> AsyncGenerator[aiosqlite.Connection, None]:
         yield db
 
 
+# =============================================================================
+# Application Lifespan
+# =============================================================================
+
+async def init_schema(db: aiosqlite.Connection) -> None:
+    """
+    Create the table and indexes, migrating an AUTOINCREMENT table first.
+
+    Args:
+        db: Writer connection.
+    """
+    table_ddl, *index_ddl = DDL_STATEMENTS
+    await db.execute(table_ddl)
+
+    cursor = await db.execute(SQL_ROUNDS_SCHEMA)
+    schema = await cursor.fetchone()
+    if schema and "AUTOINCREMENT" in schema[0].upper():
+        logger.info("Migrating spacexy_rounds to drop AUTOINCREMENT...")
+        await db.executescript(SQL_DROP_AUTOINCREMENT)
+
+    for statement in index_ddl:
+        await db.execute(statement)
+    await db.commit()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Application lifespan: open the pool and schema on startup, close on exit.
+
+    Args:
+        app: The FastAPI application.
+
+    Raises:
+        Exception: Re-raised if the database cannot be initialized.
+    """
+    logger.info("Starting Space XY Tracker API...")
+
+    try:
+        await db_manager.open()
+        async with db_manager.writer() as db:
+            await init_schema(db)
+        logger.info("Database initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize database: {e}", exc_info=True)
+        raise
+
+    try:
+        yield
+    finally:
+        await db_manager.close()
+
+
 # =============================================================================
 # FastAPI Application Setup
 # =============================================================================
@@ -283,7 +620,8 @@ app = FastAPI(
     description="Real-time statistics API for BGaming Space XY crash game",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 
@@ -296,18 +634,56 @@ app.add_middleware(
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=False,  # API doesn't require credentials
     allow_methods=["GET", "HEAD", "OPTIONS"],  # Read-only API
-    allow_headers=["Content-Type", "Accept"],
-    expose_headers=["Content-Length", "Content-Range"],
+    allow_headers=["Content-Type", "Accept", "If-None-Match"],
+    expose_headers=["Content-Length", "Content-Range", "Content-Encoding", "ETag"],
     max_age=3600,
 )
 
 
+# =============================================================================
+# Response Compression
+# =============================================================================
+
+# JSON payloads compress well; small responses like /api/health are
+# left uncompressed since gzip overhead would outweigh the savings
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+# =============================================================================
+# Timestamp Helpers
+# =============================================================================
+
+_iso_cache: Dict[str, Any] = {"tick": -1, "value": ""}
+
+
+def utc_now_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string.
+
+    The string is rebuilt at most once per TIMESTAMP_RESOLUTION, so error
+    storms and frequent health probes reuse it instead of allocating a
+    datetime per response.
+
+    Returns:
+        str: Timestamp like "2026-01-17T10:35:00.123456".
+    """
+    now = time.time()
+    tick = int(now / TIMESTAMP_RESOLUTION)
+    if tick != _iso_cache["tick"]:
+        _iso_cache["tick"] = tick
+        _iso_cache["value"] = (
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+            + f".{int(now % 1 * 1_000_000):06d}"
+        )
+    return _iso_cache["value"]
+
+
 # =============================================================================
 # Exception Handlers
 # =============================================================================
 
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Global exception handler for unhandled exceptions.
 
@@ -316,23 +692,24 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         exc: The exception that was raised.
 
     Returns:
-        JSONResponse: Standardized error response with 500 status code.
+        Response: Standardized error response with 500 status code.
     """
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
     error_response = ErrorResponse(
         error="internal_error",
         detail="An internal server error occurred",
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=utc_now_iso(),
         request_id=request.headers.get("X-Request-ID")
     )
-    return JSONResponse(
+    return Response(
+        content=orjson.dumps(error_response.model_dump(mode="json")),
         status_code=500,
-        content=error_response.model_dump()
+        media_type="application/json"
     )
 
 
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """
     Handler for HTTP exceptions.
 
@@ -341,23 +718,24 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         exc: The HTTPException that was raised.
 
     Returns:
-        JSONResponse: Standardized error response.
+        Response: Standardized error response.
     """
     logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
     error_response = ErrorResponse(
         error="http_error",
         detail=str(exc.detail),
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=utc_now_iso(),
         request_id=request.headers.get("X-Request-ID")
     )
-    return JSONResponse(
+    return Response(
+        content=orjson.dumps(error_response.model_dump(mode="json")),
         status_code=exc.status_code,
-        content=error_response.model_dump()
+        media_type="application/json"
     )
 
 
 @app.exception_handler(ValueError)
-async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+async def value_error_handler(request: Request, exc: ValueError) -> Response:
     """
     Handler for validation errors.
 
@@ -366,66 +744,231 @@ async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse
         exc: The ValueError that was raised.
 
     Returns:
-        JSONResponse: Standardized error response with 422 status code.
+        Response: Standardized error response with 422 status code.
     """
     logger.warning(f"Validation error: {exc}")
     error_response = ErrorResponse(
         error="validation_error",
         detail=str(exc),
-        timestamp=datetime.utcnow().isoformat(),
+        timestamp=utc_now_iso(),
         request_id=request.headers.get("X-Request-ID")
     )
-    return JSONResponse(
+    return Response(
+        content=orjson.dumps(error_response.model_dump(mode="json")),
         status_code=422,
-        content=error_response.model_dump()
+        media_type="application/json"
     )
 
 
 # =============================================================================
-# Startup Event
+# Pagination Helpers
 # =============================================================================
 
-@app.on_event("startup")
-async def startup() -> None:
+def encode_cursor(created_at: Any, row_id: int) -> str:
     """
-    Application startup event handler.
+    Encode a keyset pagination position as an opaque cursor.
 
-    Creates the database table and indexes if they don't exist.
-    Logs the startup process for monitoring.
+    Args:
+        created_at: created_at value of the last row on the page.
+        row_id: id of the last row on the page.
+
+    Returns:
+        str: URL-safe cursor string.
     """
-    logger.info("Starting Space XY Tracker API...")
+    return base64.urlsafe_b64encode(f"{created_at}|{row_id}".encode()).decode()
 
+
+def decode_cursor(cursor: str) -> tuple:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response.
+
+    Returns:
+        tuple: (created_at, id) of the last row already returned.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
     try:
-        async with db_manager.connect() as db:
-            # Create main table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS spacexy_rounds (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    round_id TEXT UNIQUE NOT NULL,
-                    crash_multiplier REAL NOT NULL,
-                    coordinate_x REAL,
-                    coordinate_y REAL,
-                    hash TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Create indexes for performance
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_multiplier ON spacexy_rounds(crash_multiplier)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_created ON spacexy_rounds(created_at DESC)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_round_id ON spacexy_rounds(round_id)"
-            )
+        created_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return created_at, int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
 
-            await db.commit()
-            logger.info("Database initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize database: {e}", exc_info=True)
-        raise
+
+# =============================================================================
+# Cached Aggregates
+# =============================================================================
+
+_agg_cache: Dict[str, Tuple[float, Any]] = {}
+_agg_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def cached_aggregate(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl: float = AGGREGATE_CACHE_TTL
+) -> Any:
+    """
+    Return a cached aggregate, recomputing it once ttl expires.
+
+    Concurrent misses on the same key wait for a single recomputation.
+
+    Args:
+        key: Cache key identifying the aggregate.
+        compute: Coroutine factory that computes a fresh value.
+        ttl: Seconds a computed value stays fresh.
+
+    Returns:
+        Any: Cached or freshly computed value.
+    """
+    hit = _agg_cache.get(key)
+    if hit and time.monotonic() - hit[0] < ttl:
+        return hit[1]
+
+    async with _agg_locks.setdefault(key, asyncio.Lock()):
+        hit = _agg_cache.get(key)
+        now = time.monotonic()
+        if hit and now - hit[0] < ttl:
+            return hit[1]
+        value = await compute()
+        _agg_cache[key] = (now, value)
+        return value
+
+
+async def versioned_aggregate(
+    key: str,
+    db: aiosqlite.Connection,
+    compute: Callable[[], Awaitable[Any]]
+) -> Tuple[str, Any]:
+    """
+    Return a cached aggregate together with the data version it was built from.
+
+    Once the TTL expires only the cheap SQL_DATA_VERSION query runs; the
+    aggregate itself is recomputed only if that version changed.
+
+    Args:
+        key: Cache key identifying the aggregate.
+        db: Database connection used for the version check.
+        compute: Coroutine factory that computes a fresh value.
+
+    Returns:
+        Tuple[str, Any]: Weak ETag for the data version and the aggregate.
+    """
+    async def refresh() -> Tuple[str, Any]:
+        cursor = await db.execute(SQL_DATA_VERSION)
+        count, max_id = await cursor.fetchone()
+        etag = f'W/"{count}-{max_id or 0}"'
+        hit = _agg_cache.get(key)
+        if hit and hit[1][0] == etag:
+            return hit[1]
+        return etag, await compute()
+
+    return await cached_aggregate(key, refresh)
+
+
+def not_modified(request: Request, response: Response, etag: str) -> bool:
+    """
+    Set caching headers and report whether the client's copy is current.
+
+    Args:
+        request: Incoming request, checked for If-None-Match.
+        response: Outgoing response that receives ETag and Cache-Control.
+        etag: ETag of the data being served.
+
+    Returns:
+        bool: True if the request's If-None-Match matches etag.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"public, max-age={int(AGGREGATE_CACHE_TTL)}"
+    return request.headers.get("if-none-match") == etag
+
+
+async def fetch_total_rounds(db: aiosqlite.Connection) -> int:
+    """
+    Count all stored rounds.
+
+    Args:
+        db: Database connection to query.
+
+    Returns:
+        int: Number of rows in spacexy_rounds.
+    """
+    cursor = await db.execute(SQL_COUNT_ROUNDS)
+    return (await cursor.fetchone())[0]
+
+
+async def fetch_last_update(db: aiosqlite.Connection) -> Optional[str]:
+    """
+    Look up when the newest round was stored.
+
+    Args:
+        db: Database connection to query.
+
+    Returns:
+        Optional[str]: created_at of the newest round, or None if the
+        table is empty.
+    """
+    cursor = await db.execute(SQL_HEALTH_LAST)
+    row = await cursor.fetchone()
+    return str(row[0]) if row and row[0] else None
+
+
+async def fetch_summary(db: aiosqlite.Connection) -> SummaryStats:
+    """
+    Compute summary statistics over all stored rounds.
+
+    Args:
+        db: Database connection to query.
+
+    Returns:
+        SummaryStats: Counts, average, median and extremes of all rounds.
+    """
+    # Get main statistics in a single query
+    cursor = await db.execute(SQL_SUMMARY)
+    row = await cursor.fetchone()
+
+    # Calculate median: reuse the count above and walk idx_multiplier
+    cursor = await db.execute(SQL_MEDIAN, ((row[0] or 0) // 2,))
+    median_row = await cursor.fetchone()
+    median = median_row[0] if median_row else 0.0
+
+    return SummaryStats(
+        total_rounds=row[0] or 0,
+        avg_multiplier=round(row[1] or 0, 4),
+        max_multiplier=row[2] or 0,
+        min_multiplier=row[3] or 0,
+        median_multiplier=round(median, 4),
+        under_2x_count=row[4] or 0,
+        over_10x_count=row[5] or 0
+    )
+
+
+async def fetch_distribution(db: aiosqlite.Connection) -> List[DistributionBucket]:
+    """
+    Count rounds per distribution bucket.
+
+    Args:
+        db: Database connection to query.
+
+    Returns:
+        List[DistributionBucket]: Count and percentage for each range in
+        DISTRIBUTION_BUCKETS, in order.
+    """
+    cursor = await db.execute(SQL_DISTRIBUTION)
+    row = await cursor.fetchone()
+    total = row[-1] or 1  # Avoid division by zero
+
+    return _DISTRIBUTION_ADAPTER.validate_python([
+        {
+            "range": name,
+            "count": count or 0,
+            "percentage": round(((count or 0) / total) * 100, 2),
+        }
+        for (name, _), count in zip(DISTRIBUTION_BUCKETS, row)
+    ])
 
 
 # =============================================================================
@@ -443,64 +986,98 @@ async def get_rounds(
     offset: int = Query(
         default=0,
         ge=0,
-        description="Number of rounds to skip (must be >= 0)"
+        description="Number of rounds to skip (must be >= 0). Slow for deep pages; prefer cursor"
+    ),
+    page_cursor: Optional[str] = Query(
+        default=None,
+        alias="cursor",
+        description="next_cursor from the previous page; overrides offset"
+    ),
+    include_total: Optional[bool] = Query(
+        default=None,
+        description="Count all rounds; defaults to true without a cursor, false with one"
     ),
     db: aiosqlite.Connection = Depends(get_db)
-) -> RoundsResponse:
+) -> Response:
     """
     Get paginated list of game rounds.
 
     Retrieves game rounds ordered by creation time (most recent first).
-    Supports pagination through limit and offset parameters.
+    Supports keyset pagination through the cursor parameter, and legacy
+    limit/offset pagination whose cost grows with the offset.
+
+    Rows are encoded straight to JSON bytes; RoundsResponse only documents
+    the shape, so no Round model is built per row.
 
     Args:
         limit: Maximum number of rounds to return (default: 50, max: 500).
         offset: Number of rounds to skip for pagination (default: 0).
+        page_cursor: Cursor returned as next_cursor by the previous page.
+        include_total: Whether to count all rounds. Clients paging with a
+            cursor should keep the total from the first page.
         db: Database connection (injected).
 
     Returns:
-        RoundsResponse: Paginated list of rounds with total count.
+        Response: JSON body shaped like RoundsResponse, with the paginated
+        rounds, total count and the cursor for the next page.
 
     Raises:
         HTTPException: If database query fails.
+        ValueError: If the cursor is malformed.
 
     Example:
-        GET /api/rounds?limit=100&offset=0
-        Response: {"items": [...], "total": 5000}
+        GET /api/rounds?limit=100
+        Response: {"items": [...], "total": 5000, "next_cursor": "MjAyNi0..."}
+        GET /api/rounds?limit=100&cursor=MjAyNi0...
+        Response: {"items": [...], "total": null, "next_cursor": "MjAyNi0..."}
     """
-    logger.debug(f"Fetching rounds with limit={limit}, offset={offset}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Fetching rounds with limit={limit}, offset={offset}, cursor={page_cursor}")
+
+    # An empty ?cursor= means the first page, for paging and the total alike
+    page_cursor = page_cursor or None
 
     try:
-        # Get total count
-        cursor = await db.execute("SELECT COUNT(*) FROM spacexy_rounds")
-        total = (await cursor.fetchone())[0]
+        if include_total is None:
+            include_total = page_cursor is None
+        total = (
+            await cached_aggregate("total_rounds", lambda: fetch_total_rounds(db))
+            if include_total else None
+        )
 
         # Get paginated rounds
-        cursor = await db.execute(
-            """
-            SELECT round_id, crash_multiplier, coordinate_x, coordinate_y, hash, created_at
-            FROM spacexy_rounds
-            ORDER BY created_at DESC
-            LIMIT ? OFFSET ?
-            """,
-            (limit, offset)
-        )
+        if page_cursor:
+            cursor = await db.execute(
+                SQL_SELECT_ROUNDS_AFTER, (*decode_cursor(page_cursor), limit)
+            )
+        else:
+            cursor = await db.execute(SQL_SELECT_ROUNDS_PAGE, (limit, offset))
         rows = await cursor.fetchall()
 
+        # Rows are plain tuples in SELECT column order (see SQL_SELECT_ROUNDS_PAGE)
         items = [
-            Round(
-                round_id=row["round_id"],
-                crash_multiplier=row["crash_multiplier"],
-                coordinate_x=row["coordinate_x"],
-                coordinate_y=row["coordinate_y"],
-                hash=row["hash"],
-                created_at=row["created_at"]
-            )
-            for row in rows
+            {
+                "round_id": round_id,
+                "crash_multiplier": crash_multiplier,
+                "coordinate_x": coordinate_x,
+                "coordinate_y": coordinate_y,
+                "hash": hash_value,
+                "created_at": datetime.fromisoformat(created_at),
+            }
+            for (
+                _, round_id, crash_multiplier, coordinate_x, coordinate_y, hash_value, created_at
+            ) in rows
         ]
 
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = encode_cursor(rows[-1][6], rows[-1][0])
+
         logger.info(f"Retrieved {len(items)} rounds (total: {total})")
-        return RoundsResponse(items=items, total=total)
+        return Response(
+            content=orjson.dumps({"items": items, "total": total, "next_cursor": next_cursor}),
+            media_type="application/json"
+        )
 
     except aiosqlite.Error as e:
         logger.error(f"Database error fetching rounds: {e}", exc_info=True)
@@ -511,14 +1088,21 @@ async def get_rounds(
 
 
 @app.get("/api/stats/summary", response_model=SummaryStats)
-async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> SummaryStats:
+async def get_summary(
+    request: Request,
+    response: Response,
+    db: aiosqlite.Connection = Depends(get_db)
+) -> SummaryStats:
     """
     Get summary statistics for all game rounds.
 
     Calculates aggregate statistics including average, median, min, max
-    multipliers and count of rounds in specific ranges.
+    multipliers and count of rounds in specific ranges. Responses carry
+    an ETag; a matching If-None-Match gets 304 Not Modified.
 
     Args:
+        request: Incoming request (injected).
+        response: Outgoing response for caching headers (injected).
         db: Database connection (injected).
 
     Returns:
@@ -534,37 +1118,9 @@ async def get_summary(db: aiosqlite.Connection = Depends(get_db)) -> SummaryStat
     logger.debug("Fetching summary statistics")
 
     try:
-        # Get main statistics in a single query
-        cursor = await db.execute("""
-            SELECT
-                COUNT(*) as total,
-                AVG(crash_multiplier) as avg,
-                MAX(crash_multiplier) as max,
-                MIN(crash_multiplier) as min,
-                SUM(CASE WHEN crash_multiplier < 2 THEN 1 ELSE 0 END) as under_2x,
-                SUM(CASE WHEN crash_multiplier >= 10 THEN 1 ELSE 0 END) as over_10x
-            FROM spacexy_rounds
-        """)
-        row = await cursor.fetchone()
-
-        # Calculate median
-        cursor = await db.execute("""
-            SELECT crash_multiplier FROM spacexy_rounds
-            ORDER BY crash_multiplier
-            LIMIT 1 OFFSET (SELECT COUNT(*) FROM spacexy_rounds) / 2
-        """)
-        median_row = await cursor.fetchone()
-        median = median_row[0] if median_row else 0.0
-
-        result = SummaryStats(
-            total_rounds=row[0] or 0,
-            avg_multiplier=round(row[1] or 0, 4),
-            max_multiplier=row[2] or 0,
-            min_multiplier=row[3] or 0,
-            median_multiplier=round(median, 4),
-            under_2x_count=row[4] or 0,
-            over_10x_count=row[5] or 0
-        )
+        etag, result = await versioned_aggregate("summary", db, lambda: fetch_summary(db))
+        if not_modified(request, response, etag):
+            return Response(status_code=304, headers=dict(response.headers))
 
         logger.info(f"Summary stats: {result.total_rounds} total rounds")
         return result
@@ -606,20 +1162,11 @@ async def get_recent_stats(
         GET /api/stats/recent?limit=500
         Response: {"avg_multiplier": 2.35, "under_2x_pct": 52.4}
     """
-    logger.debug(f"Fetching recent stats for last {limit} rounds")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Fetching recent stats for last {limit} rounds")
 
     try:
-        cursor = await db.execute("""
-            SELECT
-                AVG(crash_multiplier) as avg_multiplier,
-                SUM(CASE WHEN crash_multiplier < 2 THEN 1 ELSE 0 END) * 100.0 / COUNT(*) as under_2x_pct
-            FROM (
-                SELECT crash_multiplier
-                FROM spacexy_rounds
-                ORDER BY created_at DESC
-                LIMIT ?
-            )
-        """, (limit,))
+        cursor = await db.execute(SQL_RECENT_STATS, (limit,))
         row = await cursor.fetchone()
 
         result = RecentStats(
@@ -640,15 +1187,20 @@ async def get_recent_stats(
 
 @app.get("/api/distribution", response_model=List[DistributionBucket])
 async def get_distribution(
+    request: Request,
+    response: Response,
     db: aiosqlite.Connection = Depends(get_db)
 ) -> List[DistributionBucket]:
     """
     Get multiplier distribution across predefined ranges.
 
     Returns the count and percentage of rounds that fall into each
-    multiplier range bucket for visualization and analysis.
+    multiplier range bucket for visualization and analysis. Responses
+    carry an ETag; a matching If-None-Match gets 304 Not Modified.
 
     Args:
+        request: Incoming request (injected).
+        response: Outgoing response for caching headers (injected).
         db: Database connection (injected).
 
     Returns:
@@ -668,27 +1220,13 @@ async def get_distribution(
     logger.debug("Fetching multiplier distribution")
 
     try:
-        # Get total count first
-        cursor = await db.execute("SELECT COUNT(*) FROM spacexy_rounds")
-        total = (await cursor.fetchone())[0] or 1  # Avoid division by zero
-
-        result: List[DistributionBucket] = []
-
-        # Query each bucket (could be optimized with CASE statements in single query)
-        for name, condition in DISTRIBUTION_BUCKETS:
-            cursor = await db.execute(
-                f"SELECT COUNT(*) FROM spacexy_rounds WHERE crash_multiplier {condition}"
-            )
-            count = (await cursor.fetchone())[0]
-            percentage = round((count / total) * 100, 2)
-
-            result.append(DistributionBucket(
-                range=name,
-                count=count,
-                percentage=percentage
-            ))
+        etag, result = await versioned_aggregate(
+            "distribution", db, lambda: fetch_distribution(db)
+        )
+        if not_modified(request, response, etag):
+            return Response(status_code=304, headers=dict(response.headers))
 
-        logger.info(f"Distribution calculated for {total} rounds")
+        logger.info(f"Distribution calculated for {len(result)} buckets")
         return result
 
     except aiosqlite.Error as e:
@@ -699,19 +1237,43 @@ async def get_distribution(
         ) from e
 
 
+@app.get("/api/health/live", response_model=HealthResponse)
+async def health_live() -> HealthResponse:
+    """
+    Liveness probe that never touches the database.
+
+    Reports whether the connection pool is open and echoes the last data
+    update seen by the readiness probe, if any.
+
+    Returns:
+        HealthResponse: Process health status from cached state.
+    """
+    hit = _agg_cache.get("last_data_update")
+    return HealthResponse(
+        status="healthy",
+        game="spacexy",
+        database="connected" if db_manager.is_open else "disconnected",
+        last_data_update=(hit[1] or "No data") if hit else None,
+        timestamp=utc_now_iso()
+    )
+
+
 @app.get("/api/health", response_model=HealthResponse)
+@app.get("/api/health/ready", response_model=HealthResponse)
 async def health() -> HealthResponse:
     """
-    Health check endpoint for monitoring and orchestration.
+    Readiness check endpoint for monitoring and orchestration.
 
     Checks database connectivity and returns the service health status
-    along with the timestamp of the most recent data update.
+    along with the timestamp of the most recent data update. The lookup
+    is cached for HEALTH_CACHE_TTL so frequent probes don't rescan the
+    created_at index.
 
     Returns:
         HealthResponse: Service health status and metadata.
 
     Example:
-        GET /api/health
+        GET /api/health/ready
         Response: {
             "status": "healthy",
             "game": "spacexy",
@@ -724,23 +1286,18 @@ async def health() -> HealthResponse:
 
     try:
         async with db_manager.connect() as db:
-            # Check database connectivity and get last update time
-            cursor = await db.execute(
-                "SELECT MAX(created_at) FROM spacexy_rounds"
-            )
-            last_update_row = await cursor.fetchone()
-            last_update = last_update_row[0] if last_update_row and last_update_row[0] else None
-
-            response = HealthResponse(
-                status="healthy",
-                game="spacexy",
-                database="connected",
-                last_data_update=str(last_update) if last_update else "No data",
-                timestamp=datetime.utcnow().isoformat()
+            last_update = await cached_aggregate(
+                "last_data_update", lambda: fetch_last_update(db), ttl=HEALTH_CACHE_TTL
             )
 
-            logger.info("Health check: healthy")
-            return response
+        logger.debug("Health check: healthy")
+        return HealthResponse(
+            status="healthy",
+            game="spacexy",
+            database="connected",
+            last_data_update=last_update or "No data",
+            timestamp=utc_now_iso()
+        )
 
     except Exception as e:
         logger.error(f"Health check failed: {e}", exc_info=True)
@@ -749,7 +1306,7 @@ async def health() -> HealthResponse:
             game="spacexy",
             database="disconnected",
             last_data_update=None,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=utc_now_iso()
         )
 
 
@@ -759,12 +1316,22 @@ async def health() -> HealthResponse:
 
 
 # Game-specific statistics router
-crash_stats_router = create_crash_game_router(db_manager, "spacexy")
+crash_stats_router = create_crash_game_router(db_manager, "spacexy", "spacexy_rounds")
 app.include_router(crash_stats_router)
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    logger.info("Starting Space XY Tracker API server...")
-    uvicorn.run(app, host="0.0.0.0", port=8009)
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    logger.info(f"Starting Space XY Tracker API server with {workers} worker(s)...")
+    uvicorn.run(
+        # Multiple workers re-import the app, which needs an import string
+        "main:app" if workers > 1 else app,
+        host="0.0.0.0",
+        port=8009,
+        loop="auto",  # uvloop when installed, asyncio otherwise
+        http="auto",  # httptools when installed, h11 otherwise
+        workers=workers
+    )
@@ -17,15 +17,23 @@ Version: 1.0.0
 """
 
 import asyncio
-import json
 import logging
 import os
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import time
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncIterator, Deque, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import aiosqlite
-from playwright.async_api import async_playwright, Page, WebSocket
+import numpy as np
+from playwright.async_api import async_playwright, Browser, Page, WebSocket
+
+# orjson parses frames several times faster; fall back to the stdlib if absent
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 
 # =============================================================================
@@ -66,23 +74,89 @@ logger = setup_logger(__name__)
 
 DATABASE_PATH: str = os.getenv("DATABASE_PATH", "spacexy.db")
 
-# Known field names for multiplier extraction from various message formats
-MULTIPLIER_FIELDS: List[str] = [
+# Applied once to the collector's connection. WAL lets the API read while
+# batches are written; busy_timeout waits out the API's schema setup.
+# The connection runs in autocommit mode and writes open their own
+# transaction (see _transaction)
+DB_PRAGMAS: tuple = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Pending rounds are written in one transaction once either limit is hit
+INSERT_BATCH_SIZE: int = int(os.getenv("INSERT_BATCH_SIZE", "128"))
+INSERT_FLUSH_INTERVAL: float = float(os.getenv("INSERT_FLUSH_INTERVAL", "0.2"))
+
+# First non-blank character of a JSON object frame, as text or binary
+JSON_OBJECT_START: Tuple[Union[str, bytes], ...] = ("{", b"{")
+
+# Upper bound on rounds waiting for a flush; if the database stalls the
+# oldest are dropped instead of growing memory without limit
+MAX_PENDING_ROUNDS: int = int(os.getenv("MAX_PENDING_ROUNDS", "1024"))
+
+# Maximum WebSocket frames parsed per wakeup of the frame consumer
+FRAME_BATCH_SIZE: int = 128
+
+# (round_id, crash_multiplier, coordinate_x, coordinate_y, hash) in INSERT order
+RoundRow = Tuple[str, float, Optional[float], Optional[float], Optional[str]]
+
+INSERT_ROUND_SQL: str = """
+    INSERT OR IGNORE INTO spacexy_rounds
+        (round_id, crash_multiplier, coordinate_x, coordinate_y, hash)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# Errors raised by a single unbindable or invalid row; they fail the whole
+# executemany, so the batch is retried row by row to skip only that row
+ROW_ERRORS: Tuple[type, ...] = (aiosqlite.ProgrammingError, aiosqlite.IntegrityError)
+
+# Secondary indexes, kept in sync with the API's DDL_STATEMENTS; a bulk
+# load creates them after its rows are written
+INDEX_DDL: Tuple[str, ...] = (
+    "CREATE INDEX IF NOT EXISTS idx_multiplier ON spacexy_rounds(crash_multiplier)",
+    """
+    CREATE INDEX IF NOT EXISTS idx_rounds_page ON spacexy_rounds(
+        created_at DESC, id DESC,
+        round_id, crash_multiplier, coordinate_x, coordinate_y, hash
+    )
+    """,
+    "DROP INDEX IF EXISTS idx_created",
+)
+
+# Known field names for multiplier extraction from various message formats,
+# in priority order (first match wins)
+MULTIPLIER_FIELDS: Tuple[str, ...] = (
     'multiplier', 'crash', 'crashedAt', 'result', 'payout',
     'crashMultiplier', 'odds', 'coefficient', 'crashPoint', 'x'
-]
+)
 
-# Known field names for round ID extraction
-ROUND_ID_FIELDS: List[str] = [
+# Known field names for round ID extraction, in priority order
+ROUND_ID_FIELDS: Tuple[str, ...] = (
     'roundId', 'gameId', 'id', 'round', 'roundNumber',
     'gameNumber', 'sessionId', 'round_id'
-]
+)
 
-# Message types that indicate a round has ended
-END_MESSAGE_TYPES: List[str] = [
+# Set views of the two longest field lists, so a dict holding none of the
+# names is rejected with one C-level check instead of probing every name
+MULTIPLIER_FIELD_SET: FrozenSet[str] = frozenset(MULTIPLIER_FIELDS)
+ROUND_ID_FIELD_SET: FrozenSet[str] = frozenset(ROUND_ID_FIELDS)
+
+# Known field names for the message type, in priority order
+MESSAGE_TYPE_FIELDS: Tuple[str, ...] = ('type', 't', 'action', 'event', 'messageType', 'cmd')
+
+# Known field names for Space XY coordinates
+COORDINATE_X_FIELDS: Tuple[str, ...] = ('coordinateX', 'x_coord', 'coord_x')
+COORDINATE_Y_FIELDS: Tuple[str, ...] = ('coordinateY', 'y_coord', 'coord_y')
+
+# Message types that indicate a round has ended (checked once per message)
+END_MESSAGE_TYPES: FrozenSet[str] = frozenset({
     'round_result', 'crash', 'finish', 'end', 'game_over',
     'round_end', 'busted', 'crashed', 'land'
-]
+})
 
 
 # =============================================================================
@@ -151,14 +225,28 @@ class SpaceXYCollector:
         self.rounds_collected: int = 0
         self.max_retries: int = max_retries
         self.retry_delay: float = retry_delay
+        self._pending: Deque[RoundRow] = deque(maxlen=MAX_PENDING_ROUNDS)
+        self._last_flush: float = time.monotonic()
+        self._flush_requested = asyncio.Event()
+        self._frame_q: asyncio.Queue = asyncio.Queue()
+        self._stop_event = asyncio.Event()
+        self._db: Optional[aiosqlite.Connection] = None
+        self._db_lock = asyncio.Lock()
 
         logger.info(f"SpaceXYCollector initialized with db_path={self.db_path}")
 
-    async def init_db(self) -> None:
+    async def init_db(self, bulk: bool = False) -> None:
         """
-        Initialize the database schema.
+        Open the collector's connection and initialize the database schema.
+
+        The connection is kept for the collector's lifetime and reused by
+        every flush; aclose() releases it. Creates the spacexy_rounds table
+        if it doesn't exist.
 
-        Creates the spacexy_rounds table if it doesn't exist.
+        Args:
+            bulk: If True, skip the secondary indexes so a following bulk
+                load does not maintain them row by row; the loader calls
+                _create_indexes() once its rows are written.
 
         Raises:
             DatabaseError: If database initialization fails.
@@ -166,10 +254,15 @@ class SpaceXYCollector:
         logger.info("Initializing database...")
 
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            if self._db is None:
+                self._db = await aiosqlite.connect(self.db_path, isolation_level=None)
+                for pragma in DB_PRAGMAS:
+                    await self._db.execute(pragma)
+
+            async with self._transaction() as db:
                 await db.execute("""
                     CREATE TABLE IF NOT EXISTS spacexy_rounds (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        id INTEGER PRIMARY KEY,
                         round_id TEXT UNIQUE NOT NULL,
                         crash_multiplier REAL NOT NULL,
                         coordinate_x REAL,
@@ -178,18 +271,61 @@ class SpaceXYCollector:
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 """)
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_created ON spacexy_rounds(created_at DESC)"
-                )
-                await db.execute(
-                    "CREATE INDEX IF NOT EXISTS idx_multiplier ON spacexy_rounds(crash_multiplier)"
-                )
-                await db.commit()
-                logger.info("Database initialized successfully")
+                if not bulk:
+                    for statement in INDEX_DDL:
+                        await db.execute(statement)
+            logger.info("Database initialized successfully")
         except aiosqlite.Error as e:
             logger.error(f"Database initialization failed: {e}", exc_info=True)
+            await self.aclose()
             raise DatabaseError(f"Failed to initialize database: {e}") from e
 
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Hold the connection lock for one explicit transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so a concurrent
+        writer is waited out by busy_timeout at the start rather than
+        failing midway through the batch. Commits when the block exits
+        normally and rolls back if the block or the commit raises, so the
+        connection never stays inside a transaction.
+
+        Yields:
+            aiosqlite.Connection: The collector's connection.
+        """
+        async with self._db_lock:
+            db = self._db
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                yield db
+                await db.commit()
+            except BaseException:
+                await db.rollback()
+                raise
+
+    async def _create_indexes(self) -> None:
+        """
+        Create any missing secondary indexes on spacexy_rounds.
+
+        Raises:
+            DatabaseError: If index creation fails.
+        """
+        try:
+            async with self._transaction() as db:
+                for statement in INDEX_DDL:
+                    await db.execute(statement)
+        except aiosqlite.Error as e:
+            logger.error(f"Index creation failed: {e}", exc_info=True)
+            raise DatabaseError(f"Failed to create indexes: {e}") from e
+
+    async def aclose(self) -> None:
+        """Close the collector's database connection if it is open."""
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+            logger.info("Database connection closed")
+
     async def save_round(
         self,
         round_id: str,
@@ -199,7 +335,11 @@ class SpaceXYCollector:
         hash_value: Optional[str] = None
     ) -> bool:
         """
-        Save a game round to the database.
+        Queue a game round for saving to the database.
+
+        Rounds are held in _pending and written by _flush() once
+        INSERT_BATCH_SIZE rounds are pending or INSERT_FLUSH_INTERVAL has
+        elapsed.
 
         Args:
             round_id: Unique identifier for the round.
@@ -209,7 +349,7 @@ class SpaceXYCollector:
             hash_value: Optional provably fair hash.
 
         Returns:
-            bool: True if round was saved successfully, False otherwise.
+            bool: False if a triggered flush failed, True otherwise.
 
         Raises:
             ValueError: If multiplier is not positive.
@@ -219,28 +359,123 @@ class SpaceXYCollector:
             logger.error(f"Invalid multiplier value: {multiplier} (must be > 0)")
             raise ValueError(f"Multiplier must be positive, got {multiplier}")
 
+        self._enqueue_round((round_id, multiplier, coordinate_x, coordinate_y, hash_value))
+
+        if (
+            len(self._pending) >= INSERT_BATCH_SIZE
+            or time.monotonic() - self._last_flush >= INSERT_FLUSH_INTERVAL
+        ):
+            return await self._flush()
+        return True
+
+    def _enqueue_round(self, row: RoundRow) -> None:
+        """
+        Add a validated round to the pending batch without awaiting.
+
+        Wakes the flush loop early once a full batch is pending.
+
+        Args:
+            row: Round values in INSERT order.
+        """
+        if len(self._pending) == MAX_PENDING_ROUNDS:
+            logger.warning(f"Pending rounds full ({MAX_PENDING_ROUNDS}), dropping oldest")
+        self._pending.append(row)
+
+        # Skip building the message entirely when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            round_id, multiplier, coordinate_x, coordinate_y, _ = row
+            coord_str = f" (X:{coordinate_x:.1f}, Y:{coordinate_y:.1f})" if coordinate_x and coordinate_y else ""
+            logger.info(f"Round queued: round_id={round_id}, multiplier={multiplier:.2f}x{coord_str}")
+
+        if len(self._pending) >= INSERT_BATCH_SIZE:
+            self._flush_requested.set()
+
+    async def _flush_periodically(self) -> None:
+        """
+        Flush pending rounds every INSERT_FLUSH_INTERVAL, or sooner when a
+        batch fills, until the collector stops.
+
+        After a failed write the requeued rounds are retried with a delay
+        that doubles up to retry_delay, rather than on every full batch.
+        """
+        delay = INSERT_FLUSH_INTERVAL
+        while self.running:
+            if delay > INSERT_FLUSH_INTERVAL:
+                await asyncio.sleep(delay)
+            else:
+                try:
+                    await asyncio.wait_for(self._flush_requested.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+            self._flush_requested.clear()
+            if await self._flush():
+                delay = INSERT_FLUSH_INTERVAL
+            else:
+                delay = min(delay * 2, max(self.retry_delay, INSERT_FLUSH_INTERVAL * 2))
+
+    async def _flush(self) -> bool:
+        """
+        Write all pending rounds with a single executemany and commit.
+
+        If the write fails the batch is put back at the front of _pending,
+        in order, so the next flush retries it.
+
+        Returns:
+            bool: True if the batch was written (or empty), False on error.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return True
+
+        # Swap the queue out first so rounds queued meanwhile go to the next batch
+        batch, self._pending = self._pending, deque(maxlen=MAX_PENDING_ROUNDS)
+        if await self._write_rows(batch):
+            return True
+
+        self._pending.extendleft(reversed(batch))
+        return False
+
+    async def _write_rows(self, batch: Union[Deque[RoundRow], List[RoundRow]]) -> bool:
+        """
+        Insert rounds with a single executemany and commit.
+
+        Uses the connection opened by init_db(), opening it on first use.
+        Duplicate round IDs are ignored and not counted as collected. If a
+        row cannot be stored, the batch is inserted row by row in the same
+        transaction and only the failing rows are skipped.
+
+        Args:
+            batch: Rounds in INSERT order.
+
+        Returns:
+            bool: True if the batch was written, False on error.
+        """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute(
-                    """INSERT OR IGNORE INTO spacexy_rounds
-                       (round_id, crash_multiplier, coordinate_x, coordinate_y, hash)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (round_id, multiplier, coordinate_x, coordinate_y, hash_value)
-                )
-                await db.commit()
-                self.rounds_collected += 1
-
-                coord_str = f" (X:{coordinate_x:.1f}, Y:{coordinate_y:.1f})" if coordinate_x and coordinate_y else ""
-                logger.info(
-                    f"Round saved: round_id={round_id}, multiplier={multiplier:.2f}x{coord_str}, "
-                    f"total_collected={self.rounds_collected}"
-                )
-                return True
-        except aiosqlite.IntegrityError:
-            logger.debug(f"Round {round_id} already exists (duplicate)")
-            return False
-        except aiosqlite.Error as e:
-            logger.error(f"Failed to save round {round_id}: {e}", exc_info=True)
+            if self._db is None:
+                await self.init_db()
+
+            async with self._transaction() as db:
+                changes_before = db.total_changes
+                try:
+                    await db.executemany(INSERT_ROUND_SQL, batch)
+                except ROW_ERRORS as e:
+                    logger.warning(f"Batch insert failed ({e}), retrying rounds one at a time")
+                    # Rows stored before the failure are ignored as duplicates
+                    for row in batch:
+                        try:
+                            await db.execute(INSERT_ROUND_SQL, row)
+                        except ROW_ERRORS as row_error:
+                            logger.error(f"Skipping round {row[0]!r}: {row_error}")
+                inserted = db.total_changes - changes_before
+            self.rounds_collected += inserted
+
+            logger.info(
+                f"Saved batch of {len(batch)} rounds ({inserted} new), "
+                f"total_collected={self.rounds_collected}"
+            )
+            return True
+        except (aiosqlite.Error, DatabaseError) as e:
+            logger.error(f"Failed to save batch of {len(batch)} rounds: {e}", exc_info=True)
             return False
 
     async def collect_with_playwright(self, demo_url: str) -> None:
@@ -258,56 +493,93 @@ class SpaceXYCollector:
         """
         logger.info(f"Starting Playwright collection from {demo_url}")
 
+        consumer = asyncio.create_task(self._consume_frames())
+
+        try:
+            await self._collect_with_retries(demo_url)
+        finally:
+            consumer.cancel()
+            # Let the consumer finish unwinding before draining its queue
+            with suppress(asyncio.CancelledError):
+                await consumer
+            # Parse frames that arrived after the consumer's last wakeup
+            leftover = []
+            while not self._frame_q.empty():
+                leftover.append(self._frame_q.get_nowait())
+            self._process_frames(leftover)
+
+    async def _collect_with_retries(self, demo_url: str) -> None:
+        """
+        Run the browser session, reconnecting with exponential backoff.
+
+        One Chromium instance is shared by every attempt; a retry only
+        opens a fresh context and page, and relaunches the browser only if
+        it has disconnected.
+
+        Args:
+            demo_url: URL of the demo game to collect data from.
+
+        Raises:
+            ConnectionError: If unable to connect after max retries.
+        """
         retry_count: int = 0
+        browser: Optional[Browser] = None
 
-        while self.running and retry_count < self.max_retries:
+        async with async_playwright() as p:
             try:
-                async with async_playwright() as p:
-                    browser = await p.chromium.launch(headless=True)
-                    context = await browser.new_context(
-                        viewport={"width": 1920, "height": 1080},
-                        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-                    )
-                    page = await context.new_page()
+                while self.running and retry_count < self.max_retries:
+                    try:
+                        if browser is None or not browser.is_connected():
+                            browser = await p.chromium.launch(headless=True)
 
-                    # Set up WebSocket message handler
-                    page.on("websocket", lambda ws: self._setup_websocket_handler(ws))
+                        context = await browser.new_context(
+                            viewport={"width": 1920, "height": 1080},
+                            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+                        )
+                        page = await context.new_page()
 
-                    try:
-                        await page.goto(demo_url, wait_until="networkidle", timeout=60000)
-                        logger.info("Page loaded successfully, monitoring for rounds...")
+                        # Set up WebSocket message handler
+                        page.on("websocket", lambda ws: self._setup_websocket_handler(ws))
 
-                        # Reset retry count on successful connection
-                        retry_count = 0
+                        try:
+                            await page.goto(demo_url, wait_until="networkidle", timeout=60000)
+                            logger.info("Page loaded successfully, monitoring for rounds...")
 
-                        # Keep collecting while running
-                        while self.running:
-                            await asyncio.sleep(1)
+                            # Reset retry count on successful connection
+                            retry_count = 0
 
-                    except Exception as e:
-                        logger.error(f"Page navigation error: {e}", exc_info=True)
-                        raise
+                            # Keep collecting until stop() is called
+                            await self._stop_event.wait()
 
-                    finally:
-                        await browser.close()
-                        logger.info("Browser closed")
+                        except Exception as e:
+                            logger.error(f"Page navigation error: {e}", exc_info=True)
+                            raise
 
-            except Exception as e:
-                retry_count += 1
-                wait_time = self.retry_delay * (2 ** (retry_count - 1))  # Exponential backoff
-
-                logger.warning(
-                    f"Collection failed (attempt {retry_count}/{self.max_retries}): {e}. "
-                    f"Retrying in {wait_time:.1f}s..."
-                )
-
-                if retry_count < self.max_retries:
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(f"Max retries ({self.max_retries}) exceeded. Stopping collection.")
-                    raise ConnectionError(
-                        f"Failed to connect after {self.max_retries} attempts"
-                    ) from e
+                        finally:
+                            await context.close()
+
+                    except Exception as e:
+                        retry_count += 1
+                        wait_time = self.retry_delay * (2 ** (retry_count - 1))  # Exponential backoff
+
+                        logger.warning(
+                            f"Collection failed (attempt {retry_count}/{self.max_retries}): {e}. "
+                            f"Retrying in {wait_time:.1f}s..."
+                        )
+
+                        if retry_count < self.max_retries:
+                            await asyncio.sleep(wait_time)
+                        else:
+                            logger.error(
+                                f"Max retries ({self.max_retries}) exceeded. Stopping collection."
+                            )
+                            raise ConnectionError(
+                                f"Failed to connect after {self.max_retries} attempts"
+                            ) from e
+            finally:
+                if browser is not None:
+                    await browser.close()
+                    logger.info("Browser closed")
 
     def _setup_websocket_handler(self, ws: WebSocket) -> None:
         """
@@ -318,28 +590,55 @@ class SpaceXYCollector:
         """
         logger.info(f"WebSocket connected: {ws.url}")
 
-        def on_message(payload: str) -> None:
-            """Handle incoming WebSocket message."""
+        # Frames are only queued here; _consume_frames parses them in bursts
+        ws.on("framereceived", self._frame_q.put_nowait)
+        ws.on("close", lambda: logger.info(f"WebSocket closed: {ws.url}"))
+
+    async def _consume_frames(self) -> None:
+        """
+        Drain queued WebSocket frames in batches of up to FRAME_BATCH_SIZE.
+
+        Waits for one frame, then takes whatever else is already queued,
+        so a burst of frames is handled in one wakeup.
+        """
+        while True:
+            batch = [await self._frame_q.get()]
+            while len(batch) < FRAME_BATCH_SIZE and not self._frame_q.empty():
+                batch.append(self._frame_q.get_nowait())
+            self._process_frames(batch)
+
+    def _process_frames(self, frames: List[Union[str, bytes]]) -> None:
+        """
+        Parse a batch of raw frames, isolating failures per frame.
+
+        Args:
+            frames: Raw WebSocket payloads in arrival order.
+        """
+        for payload in frames:
             try:
                 self._process_websocket_message(payload)
             except Exception as e:
                 logger.error(f"Error processing WebSocket message: {e}", exc_info=True)
 
-        ws.on("framereceived", lambda payload: on_message(payload))
-        ws.on("close", lambda: logger.info(f"WebSocket closed: {ws.url}"))
-
-    def _process_websocket_message(self, message: str) -> None:
+    def _process_websocket_message(self, message: Union[str, bytes]) -> None:
         """
         Process a raw WebSocket message.
 
+        Only JSON objects can carry a round, so heartbeats, socket.io
+        envelopes and arrays are dropped before decoding.
+
         Args:
-            message: Raw WebSocket message string.
+            message: Raw WebSocket message (text or binary frame).
         """
+        if isinstance(message, (str, bytes)) and message.lstrip()[:1] not in JSON_OBJECT_START:
+            return
+
         try:
-            data = json.loads(message) if isinstance(message, str) else message
+            data = _json.loads(message) if isinstance(message, (str, bytes)) else message
             self.parse_ws_message(data)
-        except json.JSONDecodeError as e:
-            logger.debug(f"Non-JSON message received: {message[:100]}...")
+        except _json.JSONDecodeError as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Non-JSON message received: {message[:100]}...")
         except Exception as e:
             logger.error(f"Failed to process message: {e}", exc_info=True)
 
@@ -358,17 +657,19 @@ class SpaceXYCollector:
             This implementation handles common patterns found in crash games.
         """
         if not isinstance(data, dict):
-            logger.debug(f"Skipping non-dict message: {type(data)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Skipping non-dict message: {type(data)}")
             return
 
         # Check if this is a round-end message
         msg_type = self._extract_message_type(data)
         if msg_type and msg_type.lower() not in END_MESSAGE_TYPES:
-            logger.debug(f"Skipping non-end message type: {msg_type}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Skipping non-end message type: {msg_type}")
             return
 
-        # Extract multiplier
-        multiplier = self._extract_multiplier(data)
+        # Extract all round fields in one walk over the message
+        multiplier, round_id, coordinate_x, coordinate_y, hash_value = self._extract_all(data)
         if multiplier is None:
             logger.debug("No multiplier found in message")
             return
@@ -378,27 +679,15 @@ class SpaceXYCollector:
             logger.warning(f"Invalid multiplier value: {multiplier}")
             return
 
-        # Extract round ID
-        round_id = self._extract_round_id(data)
         if round_id is None:
             # Generate a round ID if not found
-            round_id = f"spacexy_{datetime.now().timestamp()}"
-            logger.debug(f"Generated round_id: {round_id}")
-
-        # Extract Space XY specific data
-        coordinate_x = self._extract_coordinate_x(data)
-        coordinate_y = self._extract_coordinate_y(data)
-        hash_value = data.get("hash")
-
-        # Save the round asynchronously
-        asyncio.create_task(
-            self.save_round(
-                str(round_id),
-                float(multiplier),
-                coordinate_x,
-                coordinate_y,
-                hash_value
-            )
+            round_id = f"spacexy_{time.time_ns()}"
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Generated round_id: {round_id}")
+
+        # Queue the round for the next batched write
+        self._enqueue_round(
+            (str(round_id), float(multiplier), coordinate_x, coordinate_y, hash_value)
         )
 
     def _extract_message_type(self, data: Dict[str, Any]) -> Optional[str]:
@@ -411,100 +700,110 @@ class SpaceXYCollector:
         Returns:
             Optional[str]: Message type if found, None otherwise.
         """
-        for field in ['type', 't', 'action', 'event', 'messageType', 'cmd']:
+        for field in MESSAGE_TYPE_FIELDS:
             if field in data:
                 return str(data[field])
         return None
 
-    def _extract_multiplier(self, data: Dict[str, Any]) -> Optional[float]:
+    def _extract_all(
+        self,
+        data: Dict[str, Any]
+    ) -> Tuple[Optional[float], Optional[str], Optional[float], Optional[float], Optional[str]]:
         """
-        Extract multiplier value from data dictionary.
+        Extract every round field from a message in one pass.
+
+        The multiplier and round ID are searched in the message and then in
+        nested 'result'/'data' payloads, filling each the first time it is
+        found; coordinates and hash are read from the top level only. Round
+        ID and hash are kept only when they are scalars, as strings.
 
         Args:
             data: Message data dictionary.
 
         Returns:
-            Optional[float]: Multiplier value if found and valid, None otherwise.
+            Tuple: (multiplier, round_id, coordinate_x, coordinate_y, hash),
+            with None for anything not found.
         """
-        for field in MULTIPLIER_FIELDS:
-            if field in data:
-                try:
-                    value = data[field]
-                    if isinstance(value, (int, float)):
-                        return float(value)
-                    elif isinstance(value, str):
-                        return float(value)
-                except (ValueError, TypeError) as e:
-                    logger.debug(f"Failed to convert {field}={data[field]} to float: {e}")
-                    continue
-
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_multiplier(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_multiplier(data['data'])
-
-        return None
+        multiplier: Optional[float] = None
+        round_id: Optional[str] = None
+
+        node: Optional[Dict[str, Any]] = data
+        while node is not None and (multiplier is None or round_id is None):
+            if multiplier is None and not MULTIPLIER_FIELD_SET.isdisjoint(node):
+                multiplier = self._first_float(node, MULTIPLIER_FIELDS)
+            if round_id is None and not ROUND_ID_FIELD_SET.isdisjoint(node):
+                for field in ROUND_ID_FIELDS:
+                    if field in node:
+                        round_id = self._scalar_str(node[field])
+                        break
+
+            # Check nested structures
+            node = self._nested_payload(node)
+
+        return (
+            multiplier,
+            round_id,
+            self._first_float(data, COORDINATE_X_FIELDS),
+            self._first_float(data, COORDINATE_Y_FIELDS),
+            self._scalar_str(data.get("hash")),
+        )
 
-    def _extract_round_id(self, data: Dict[str, Any]) -> Optional[str]:
+    @staticmethod
+    def _scalar_str(value: Any) -> Optional[str]:
         """
-        Extract round ID from data dictionary.
+        Return a str, int or float value as a string, anything else as None.
 
         Args:
-            data: Message data dictionary.
+            value: Raw message field value.
 
         Returns:
-            Optional[str]: Round ID if found, None otherwise.
+            Optional[str]: The value as text, or None for nulls and nested data.
         """
-        for field in ROUND_ID_FIELDS:
-            if field in data:
-                return str(data[field])
-
-        # Check nested structures
-        if 'result' in data and isinstance(data['result'], dict):
-            return self._extract_round_id(data['result'])
-
-        if 'data' in data and isinstance(data['data'], dict):
-            return self._extract_round_id(data['data'])
-
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (int, float)):
+            return str(value)
         return None
 
-    def _extract_coordinate_x(self, data: Dict[str, Any]) -> Optional[float]:
+    @staticmethod
+    def _first_float(data: Dict[str, Any], fields: Tuple[str, ...]) -> Optional[float]:
         """
-        Extract X coordinate from data dictionary.
+        Return the first of fields present in data that converts to float.
 
         Args:
             data: Message data dictionary.
+            fields: Candidate field names in priority order.
 
         Returns:
-            Optional[float]: X coordinate if found, None otherwise.
+            Optional[float]: Converted value, or None if no field qualifies.
         """
-        for field in ['coordinateX', 'x_coord', 'coord_x']:
+        for field in fields:
             if field in data:
-                try:
-                    return float(data[field])
-                except (ValueError, TypeError):
-                    continue
+                value = data[field]
+                # Nested payloads (e.g. 'result' dicts) and nulls are skipped quietly
+                if isinstance(value, (int, float, str)):
+                    try:
+                        return float(value)
+                    except ValueError as e:
+                        logger.debug(f"Failed to convert {field}={value} to float: {e}")
         return None
 
-    def _extract_coordinate_y(self, data: Dict[str, Any]) -> Optional[float]:
+    @staticmethod
+    def _nested_payload(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Extract Y coordinate from data dictionary.
+        Return the nested dict to search next: 'result', else 'data'.
 
         Args:
             data: Message data dictionary.
 
         Returns:
-            Optional[float]: Y coordinate if found, None otherwise.
+            Optional[Dict[str, Any]]: Nested dictionary, or None at a leaf.
         """
-        for field in ['coordinateY', 'y_coord', 'coord_y']:
-            if field in data:
-                try:
-                    return float(data[field])
-                except (ValueError, TypeError):
-                    continue
-        return None
+        nested = data.get('result')
+        if isinstance(nested, dict):
+            return nested
+        nested = data.get('data')
+        return nested if isinstance(nested, dict) else None
 
     async def generate_test_data(self, count: int = 100) -> None:
         """
@@ -512,37 +811,45 @@ class SpaceXYCollector:
 
         Creates simulated crash game rounds with realistic distribution.
         The distribution approximates real crash game behavior with ~3% house edge.
+        Values are drawn as whole arrays and all rounds are written in a
+        single executemany transaction, after which the secondary indexes
+        are built in one pass.
 
         Args:
             count: Number of test rounds to generate.
         """
-        import random
-
         logger.info(f"Generating {count} test rounds...")
 
-        for i in range(count):
-            # Simulate crash game distribution (house edge ~3%)
-            u = random.random()
-            if u < 0.03:  # 3% instant crash
-                multiplier = 1.0
-            else:
-                # Exponential distribution for crash games
-                multiplier = min(0.97 / (1 - u), 10000)
-                multiplier = round(multiplier, 2)
-
-            round_id = f"test_{datetime.now().timestamp()}_{i}"
-
-            # Generate random coordinates for Space XY theme
-            coord_x = round(random.uniform(0, 100), 2) if multiplier > 1.0 else None
-            coord_y = round(random.uniform(0, 100), 2) if multiplier > 1.0 else None
+        rng = np.random.default_rng()
+        base = time.time_ns()
+
+        # Simulate crash game distribution (house edge ~3%): 3% instant
+        # crash, otherwise an exponential tail capped at 10000x
+        u = rng.random(count)
+        multipliers = np.where(u < 0.03, 1.0, np.round(np.minimum(0.97 / (1 - u), 10000), 2))
+
+        # Random coordinates for Space XY theme, only for rounds that flew
+        coords = np.round(rng.uniform(0, 100, (2, count)), 2)
+        flew = (multipliers > 1.0).tolist()
+
+        rows: List[RoundRow] = [
+            (
+                f"test_{base}_{i}",
+                multiplier,
+                coord_x if has_coords else None,
+                coord_y if has_coords else None,
+                None
+            )
+            for i, (multiplier, coord_x, coord_y, has_coords) in enumerate(
+                zip(multipliers.tolist(), *coords.tolist(), flew)
+            )
+        ]
 
-            try:
-                await self.save_round(round_id, multiplier, coord_x, coord_y)
-            except ValueError as e:
-                logger.warning(f"Skipping invalid test round: {e}")
+        if not await self._write_rows(rows):
+            logger.error(f"Test data generation failed: {count} rounds not written")
+            return
 
-            # Small delay to avoid overwhelming the database
-            await asyncio.sleep(0.01)
+        await self._create_indexes()
 
         logger.info(f"Test data generation complete: {count} rounds created")
 
@@ -566,8 +873,10 @@ class SpaceXYCollector:
         """
         logger.info("Starting Space XY collector...")
 
-        await self.init_db()
+        await self.init_db(bulk=test_mode)
         self.running = True
+        self._stop_event.clear()
+        flusher = asyncio.create_task(self._flush_periodically())
 
         try:
             if test_mode:
@@ -585,19 +894,39 @@ class SpaceXYCollector:
             raise
         finally:
             self.running = False
+            self._flush_requested.set()
+            await flusher
+            await self._flush_remaining()
+            await self.aclose()
             logger.info(
                 f"Collector stopped. Total rounds collected: {self.rounds_collected}"
             )
 
+    async def _flush_remaining(self) -> None:
+        """
+        Write the rounds still pending at shutdown, retrying failed writes
+        up to max_retries times, retry_delay apart.
+        """
+        for attempt in range(1, self.max_retries + 1):
+            if await self._flush():
+                return
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_delay)
+        logger.error(
+            f"Dropping {len(self._pending)} unsaved rounds after "
+            f"{self.max_retries} failed writes"
+        )
+
     def stop(self) -> None:
         """
         Stop the collector gracefully.
 
-        Sets the running flag to False, which will cause the collection
-        loop to exit on its next iteration.
+        Clears the running flag and wakes the collection loop, which
+        closes the browser and returns immediately.
         """
         logger.info("Stop requested - collector will shut down gracefully")
         self.running = False
+        self._stop_event.set()
 
 
 # =============================================================================